@@ -0,0 +1,225 @@
+"""Aggregations of the survey data used by the explorer.
+
+The sidebar of the explorer only offers a handful of filter combinations, so
+the answer counts of every question under every combination are computed
+once (at build time, see scripts/generate_cube.py) and looked up afterwards.
+"""
+
+import hashlib
+import pickle
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from lib.survey import load_survey
+
+# ===========================================================================
+# Sidebar filters
+# ===========================================================================
+
+COUNTRIES = ["All", "United Kingdom", "Germany", "France"]
+FIELDS = ["All", "CSO Professionals", "Journalists"]
+FILTER_KEYS = list(product(COUNTRIES, FIELDS))
+
+
+def filter_mask(df, country="All", field="All"):
+    """Return a boolean row mask selecting `country` and `field`"""
+    mask = np.full(len(df.index), True)
+    for column_name, selection in [("country", country), ("field", field)]:
+        if selection == "All":
+            continue
+        mask = mask & (df[column_name] == selection).to_numpy()
+    return mask
+
+
+def filter_rows(df, country="All", field="All"):
+    """Return the positions of the rows selecting `country` and `field`"""
+    return np.flatnonzero(filter_mask(df, country, field))
+
+
+# ===========================================================================
+# Aggregate cube
+# ===========================================================================
+
+NUMERIC_SUMMARIES = ["count", "sum", "mean", "median", "min", "max"]
+
+
+def file_digest(path, size=None):
+    """Return the SHA-256 hex digest of the file at `path`.
+
+    With `size`, only the first `size` bytes of the file are digested.
+    """
+    digest = hashlib.sha256()
+    remaining = float("inf") if size is None else size
+    with open(path, "rb") as file:
+        while remaining > 0:
+            chunk = file.read(int(min(1 << 20, remaining)))
+            if not chunk:
+                break
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return digest.hexdigest()
+
+
+def summarise(df):
+    """Summarise every column of `df`.
+
+    Returns the number of respondents, the answer counts of every column (in
+    the order returned by `value_counts()`) and summary statistics of the
+    numeric columns. Only plain Python objects are stored so that the pickled
+    cube does not depend on the pandas version that wrote it.
+    """
+    numeric = df.select_dtypes("number")
+    counts = {}
+    for col in df.columns:
+        col_counts = df[col].value_counts()
+        # Categorical columns also count the answers nobody in `df` gave
+        col_counts = col_counts[col_counts > 0]
+        counts[col] = dict(zip(col_counts.index.tolist(), col_counts.tolist()))
+    return {
+        "respondents": len(df.index),
+        "counts": counts,
+        "numeric": numeric.astype("float64").agg(NUMERIC_SUMMARIES).to_dict(),
+    }
+
+
+def _to_series(cube):
+    """Turn the stored answer counts of `cube` back into Series"""
+    for cell in cube["cells"].values():
+        cell["counts"] = {
+            col: pd.Series(col_counts, name=col, dtype="int64")
+            for col, col_counts in cell["counts"].items()
+        }
+    return cube
+
+
+def build_cube(df, source=None):
+    """Summarise `df` under every combination of the sidebar filters.
+
+    Keyword arguments:
+    df     -- the cleaned survey data
+    source -- digest of the file `df` was read from (Default value = None)
+    """
+    return {
+        "source": source,
+        "cells": {
+            (country, field): summarise(df[filter_mask(df, country, field)])
+            for country, field in FILTER_KEYS
+        },
+    }
+
+
+def save_cube(cube, path):
+    with open(path, "wb") as file:
+        pickle.dump(cube, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_cube(path, source):
+    """Load the cube stored at `path`, rebuilding it if `source` has changed"""
+    digest = file_digest(source)
+    if Path(path).exists():
+        with open(path, "rb") as file:
+            cube = pickle.load(file)
+        if cube["source"] == digest:
+            return _to_series(cube)
+    return _to_series(build_cube(load_survey(source), source=digest))
+
+
+# ===========================================================================
+# Kernels
+# ===========================================================================
+
+
+def count_matrix(df, stem, options, answers):
+    """Count the answers given to the sub-questions `stem[option]` of `df`.
+
+    All sub-questions are counted in a single pass by integer coding the
+    answers against the ordered scale `answers` and binning the codes of all
+    columns at once. Answers not on the scale are ignored.
+
+    Returns a DataFrame with one row per answer and one column per option and
+    a Series with the number of respondents who answered each option.
+    """
+    values = df[[f"{stem}[{option}]" for option in options]].to_numpy()
+    codes = pd.Categorical(values.ravel(), categories=answers).codes
+    codes = codes.reshape(values.shape).astype(np.int64) + 1
+    # Shift the codes of every column into its own block of bins. Bin 0 of
+    # each block collects missing answers and answers not on the scale.
+    width = len(answers) + 1
+    codes += np.arange(len(options)) * width
+    matrix = np.bincount(codes.ravel(), minlength=len(options) * width)
+    matrix = matrix.reshape(len(options), width)[:, 1:]
+    counts = pd.DataFrame(matrix.T, index=answers, columns=options)
+    totals = pd.Series(
+        len(values) - pd.isna(values).sum(axis=0), index=options, dtype="int64"
+    )
+    return counts, totals
+
+
+def count_choices(df, stem, options, labels=None, by="country"):
+    """Count the selections of the multiple choice question `stem` by `by`.
+
+    Every `stem[option]` column holds whether the respondent selected the
+    option. All options are counted with a single groupby over the selected
+    cells.
+
+    Keyword arguments:
+    df      -- the survey data
+    stem    -- question code, e.g. "foi5"
+    options -- option codes, e.g. ["not_aware", "not_covered"]
+    labels  -- labels to use for the options (Default value = None)
+    by      -- column to break the counts down by (Default value = "country")
+
+    Returns a DataFrame with the columns "option", "count" and `by`. Options
+    are in the given order and, within each option, groups are in the order
+    they first occur in `df`. Groups without a selection are left out.
+    """
+    selected = df[[f"{stem}[{option}]" for option in options]].eq(1).to_numpy()
+    rows, option_codes = np.nonzero(selected)
+    cells = pd.DataFrame(
+        {"option": option_codes, by: df[by].to_numpy()[rows], "row": rows}
+    )
+    table = (
+        cells.groupby(["option", by], sort=False)["row"]
+        .agg(["size", "min"])
+        .reset_index()
+        .sort_values(["option", "min"])
+    )
+    return pd.DataFrame(
+        {
+            "option": np.asarray(labels or options, dtype=object)[table["option"]],
+            "count": table["size"].to_numpy(),
+            by: table[by].to_numpy(),
+        }
+    )
+
+
+def count_respondents(df, stem, options):
+    """Count the respondents who selected at least one option of `stem`"""
+    selected = df[[f"{stem}[{option}]" for option in options]].eq(1)
+    return int(selected.any(axis=1).sum())
+
+
+def count_answered(df, stem, options):
+    """Count the respondents who answered at least one sub-question of `stem`"""
+    answered = df[[f"{stem}[{option}]" for option in options]].notna()
+    return int(answered.any(axis=1).sum())
+
+
+def rank_scores(df, stem, options):
+    """Score the ranking question `stem` with a Borda count.
+
+    The column `stem[i]` holds the option ranked at position i. The rank
+    distribution of all options is counted in a single pass by `count_matrix`
+    and an option placed at position i of n scores n - i + 1 points.
+
+    Returns a DataFrame with one row per option and one column per position,
+    the Borda score of every option and how often it was ranked first.
+    """
+    positions = list(range(1, len(options) + 1))
+    distribution, _ = count_matrix(df, stem, positions, options)
+    weights = np.arange(len(positions), 0, -1)
+    scores = pd.Series(distribution.to_numpy() @ weights, index=options)
+    return distribution, scores, distribution[1]
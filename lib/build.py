@@ -0,0 +1,61 @@
+"""Incremental rebuilds of the data pipeline.
+
+A stage of the pipeline computes a digest of everything its outputs depend
+on: the contents of its input files (including its own code) and its
+parameters. The digest is recorded under the name of the stage once the
+outputs are written, and the stage can be skipped as long as its digest is
+the same and its outputs still exist. Stages may also keep intermediate
+results in BUILD, so that only the parts whose inputs changed are redone.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+from lib.aggregate import file_digest
+
+BUILD = "data/build"
+
+
+def stage_digest(inputs=(), **params):
+    """Return the digest of the contents of `inputs` and of `params`.
+
+    Keyword arguments:
+    inputs -- paths of the files the stage reads (Default value = ())
+    params -- parameters of the stage, anything JSON can encode
+    """
+    digest = hashlib.sha256()
+    for path in inputs:
+        digest.update(file_digest(path).encode())
+    digest.update(json.dumps(params, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def _stamp_path(name):
+    return Path(BUILD, f"{name}.json")
+
+
+def read_stamp(name):
+    """Return what was recorded for the stage `name`, or None"""
+    try:
+        return json.loads(_stamp_path(name).read_text())
+    except FileNotFoundError:
+        return None
+
+
+def is_current(name, digest, outputs=()):
+    """Return whether the `outputs` of the stage `name` were built from `digest`"""
+    stamp = read_stamp(name)
+    if stamp is None:
+        return False
+    return stamp["digest"] == digest and all(Path(path).exists() for path in outputs)
+
+
+def mark_current(name, digest, **details):
+    """Record that the outputs of the stage `name` were built from `digest`.
+
+    `details` are recorded along, for stages that can redo part of their work.
+    """
+    path = _stamp_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"digest": digest, **details}))
@@ -0,0 +1,80 @@
+"""A bounded cache for the figures drawn by the explorer.
+
+`@st.cache` hashes every argument of a cached function on every call, and
+the explorer passes whole DataFrames and lists of Plotly traces. Figures are
+instead keyed on a small spec: the question, the builder, the sidebar filter,
+the version of the survey data and those arguments that are plain values
+(styling such as labels, colours and sizes). The data arguments are fully
+determined by the rest of the key and are left out.
+"""
+
+import threading
+from collections import OrderedDict
+
+_PLAIN = (str, int, float, bool, type(None))
+_DATA = object()
+
+
+def _plain(value):
+    """Return a hashable copy of `value`, or `_DATA` if it is not plain"""
+    if isinstance(value, _PLAIN):
+        return value
+    if isinstance(value, (list, tuple)):
+        items = tuple(_plain(item) for item in value)
+        return _DATA if _DATA in items else items
+    if isinstance(value, dict):
+        items = tuple((key, _plain(item)) for key, item in sorted(value.items()))
+        return _DATA if any(item is _DATA for _, item in items) else items
+    return _DATA
+
+
+def figure_key(builder, question, filter_key, version, args=(), kwargs=None):
+    """Return the cache key of a figure.
+
+    Keyword arguments:
+    builder    -- name of the function drawing the figure
+    question   -- id of the question (or chart) the figure shows
+    filter_key -- the (country, field) selection of the sidebar
+    version    -- version of the survey data
+    args       -- positional arguments of the builder (Default value = ())
+    kwargs     -- keyword arguments of the builder (Default value = None)
+    """
+    spec = [(index, _plain(arg)) for index, arg in enumerate(args)]
+    spec += [(name, _plain(arg)) for name, arg in sorted((kwargs or {}).items())]
+    spec = tuple((name, arg) for name, arg in spec if arg is not _DATA)
+    return (builder, question, tuple(filter_key), version, spec)
+
+
+class FigureCache:
+    """Least recently used cache of figures with hit and miss counters"""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._figures = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        """Return the figure stored under `key`, calling `build` on a miss"""
+        with self._lock:
+            if key in self._figures:
+                self.hits += 1
+                self._figures.move_to_end(key)
+                return self._figures[key]
+            self.misses += 1
+        figure = build()
+        with self._lock:
+            self._figures[key] = figure
+            self._figures.move_to_end(key)
+            while len(self._figures) > self.maxsize:
+                self._figures.popitem(last=False)
+        return figure
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._figures),
+            "maxsize": self.maxsize,
+        }
@@ -0,0 +1,238 @@
+"""φk correlation and significance of every pair of columns.
+
+phik's `phik_matrix` and `significance_matrix` each bin the data and build
+the contingency table of every pair of columns with a pandas groupby, so
+computing both bins the data twice and builds every table twice. Here the
+columns are binned (by phik) and coded as integers once, the table of a
+pair is counted from the codes once, and both the φk value and the
+significance are derived from it, sharing its expected frequencies. The
+results are those of phik's functions, up to rounding.
+
+The pairs are independent of each other, so they are computed by a pool of
+processes, in chunks. The coded data is put in shared memory once, rather
+than sent along with every chunk.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from phik import definitions as defs
+from phik.binning import auto_bin_data
+from phik.bivariate import phik_from_chi2
+from phik.significance import significance_from_hist2d
+from scipy import special
+
+# Pairs of columns computed per task
+CHUNK_SIZE = 256
+
+# The shared codes and parameters of a worker process, see _init_worker
+_worker = {}
+
+
+def bin_codes(df, interval_cols=None, bins=10):
+    """Bin the columns of `df` as phik does and code their values as integers.
+
+    Returns the names of the columns phik keeps, the codes of every column
+    (one row per column, -1 for missing values), the number of levels of
+    every column and whether all of them make up its tables. For categorical
+    columns that is all their categories, as with pandas' groupby, and for
+    the others only the values found along with the other column of a pair.
+
+    Keyword arguments:
+    df            -- the data
+    interval_cols -- columns of interval variables, guessed by phik if None
+                     (Default value = None)
+    bins          -- number of bins of interval variables (Default value = 10)
+    """
+    binned, _ = auto_bin_data(df, interval_cols=interval_cols, bins=bins)
+    # Values in the under- and overflow bins are left out, as by phik
+    binned = binned.replace([defs.UF, defs.OF], np.nan)
+    codes = np.empty((binned.shape[1], binned.shape[0]), dtype=np.int32)
+    levels = np.empty(binned.shape[1], dtype=np.int64)
+    complete = np.empty(binned.shape[1], dtype=bool)
+    for i, (_, column) in enumerate(binned.items()):
+        complete[i] = isinstance(column.dtype, pd.CategoricalDtype)
+        if complete[i]:
+            codes[i] = column.cat.codes
+            levels[i] = len(column.cat.categories)
+        else:
+            codes[i], uniques = pd.factorize(column)
+            levels[i] = len(uniques)
+    return binned.columns, codes, levels, complete
+
+
+def contingency_table(codes, levels, complete, i, j):
+    """Return the contingency table of the columns `i` and `j`.
+
+    Keyword arguments:
+    codes, levels, complete -- as returned by `bin_codes`
+    i, j                    -- positions of the columns
+    """
+    x, y = codes[i], codes[j]
+    valid = (x >= 0) & (y >= 0)
+    table = np.bincount(
+        x[valid] * levels[j] + y[valid], minlength=levels[i] * levels[j]
+    ).reshape(levels[i], levels[j])
+    if not (complete[i] or complete[j]):
+        table = table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0]
+    return table.astype(np.float64)
+
+
+def _chi2(observed, expected, dof, lambda_):
+    """Return the chi2 of `observed` as computed by scipy's chi2_contingency"""
+    if dof == 0:
+        return 0.0
+    if dof == 1:
+        # Yates' correction
+        diff = expected - observed
+        observed = observed + np.minimum(0.5, np.abs(diff)) * np.sign(diff)
+    if lambda_ == "pearson":
+        terms = (observed - expected) ** 2 / expected
+    else:
+        terms = 2.0 * special.xlogy(observed, observed / expected)
+    return np.sum(terms)
+
+
+def phik_and_significance(
+    table, significance_method="asymptotic", noise_correction=True
+):
+    """Return the φk value and the significance of the contingency `table`.
+
+    Keyword arguments:
+    table               -- a contingency table, see `contingency_table`
+    significance_method -- "asymptotic", "MC" or "hybrid", see phik
+                           (Default value = "asymptotic")
+    noise_correction    -- apply phik's noise correction (Default value = True)
+    """
+    n = table.sum()
+    if 0 in table.shape or 1 in table.shape or n == 0:
+        return np.nan, np.nan
+    rows = table.sum(axis=1, keepdims=True)
+    columns = table.sum(axis=0, keepdims=True)
+    # The chi2 values are computed without empty rows and columns
+    observed = table[rows[:, 0] > 0][:, columns[0] > 0]
+    expected = (rows[rows > 0][:, None] * columns[columns > 0][None, :]) / n
+    dof = expected.size - sum(expected.shape) + 1
+
+    pedestal = 0
+    if noise_correction:
+        empty = np.count_nonzero(rows * columns == 0)
+        pedestal = max(table.size - sum(table.shape) + 1 - empty, 0)
+    phik = phik_from_chi2(
+        _chi2(observed, expected, dof, "pearson"),
+        n,
+        *table.shape,
+        pedestal=pedestal,
+    )
+
+    if significance_method != "asymptotic":
+        _, z_value = significance_from_hist2d(
+            table, significance_method=significance_method
+        )
+        return phik, z_value
+    chi2 = _chi2(observed, expected, dof, "log-likelihood")
+    ndof = table.size - sum(table.shape) + 1
+    p_value = special.chdtrc(ndof, chi2)
+    z_value = -special.ndtri(p_value)
+    if p_value == 0:
+        # Chernoff bound, as in phik's significance_from_chi2_ndof
+        z = chi2 / ndof
+        u = -np.log(2 * np.pi) - ndof * np.log(z) + ndof * (z - 1)
+        z_value = np.sqrt(u - np.log(u))
+    return phik, z_value
+
+
+def _pair_values(codes, levels, complete, pairs, significance_method):
+    """Return the φk values and the significances of the column `pairs`"""
+    values = np.empty((2, len(pairs)))
+    for k, (i, j) in enumerate(pairs):
+        table = contingency_table(codes, levels, complete, i, j)
+        values[:, k] = phik_and_significance(table, significance_method)
+    return values
+
+
+def _init_worker(name, shape, levels, complete, significance_method):
+    """Attach a worker process to the codes in the shared memory `name`"""
+    memory = shared_memory.SharedMemory(name=name)
+    _worker.update(
+        memory=memory,
+        codes=np.ndarray(shape, dtype=np.int32, buffer=memory.buf),
+        levels=levels,
+        complete=complete,
+        significance_method=significance_method,
+    )
+
+
+def _chunk_values(pairs):
+    return _pair_values(
+        _worker["codes"],
+        _worker["levels"],
+        _worker["complete"],
+        pairs,
+        _worker["significance_method"],
+    )
+
+
+def phik_significance_matrices(
+    df,
+    significance_method="asymptotic",
+    interval_cols=None,
+    bins=10,
+    workers=None,
+    chunk_size=CHUNK_SIZE,
+):
+    """Return the φk correlation and the significance matrices of `df`.
+
+    They are those of `df.phik_matrix()` and `df.significance_matrix()`
+    with the same arguments. The pairs of columns are computed in chunks by
+    `workers` processes, which share the binned data.
+
+    Keyword arguments:
+    df                  -- the data
+    significance_method -- "asymptotic", "MC" or "hybrid", see phik
+                           (Default value = "asymptotic")
+    interval_cols       -- columns of interval variables, guessed by phik if
+                           None (Default value = None)
+    bins                -- number of bins of interval variables
+                           (Default value = 10)
+    workers             -- number of processes, one per CPU if None and no
+                           other process if 1 (Default value = None)
+    chunk_size          -- number of pairs per task (Default value = CHUNK_SIZE)
+    """
+    columns, codes, levels, complete = bin_codes(df, interval_cols, bins)
+    rows, cols = np.triu_indices(len(columns))
+    pairs = np.column_stack([rows, cols])
+    chunks = [pairs[k : k + chunk_size] for k in range(0, len(pairs), chunk_size)]
+    if workers == 1 or len(chunks) <= 1 or codes.size == 0:
+        values = [
+            _pair_values(codes, levels, complete, chunk, significance_method)
+            for chunk in chunks
+        ]
+    else:
+        # The codes are shared with the workers instead of sent with every task
+        memory = shared_memory.SharedMemory(create=True, size=codes.nbytes)
+        try:
+            shared = np.ndarray(codes.shape, dtype=codes.dtype, buffer=memory.buf)
+            shared[:] = codes
+            del shared
+            initargs = (memory.name, codes.shape, levels, complete, significance_method)
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=initargs
+            ) as pool:
+                values = list(pool.map(_chunk_values, chunks))
+        finally:
+            memory.close()
+            memory.unlink()
+    # The values are in the order of the pairs, whichever worker computed them
+    values = np.concatenate(values, axis=1) if values else np.empty((2, 0))
+    corr = np.empty((len(columns), len(columns)))
+    sig = np.empty((len(columns), len(columns)))
+    corr[rows, cols] = corr[cols, rows] = values[0]
+    sig[rows, cols] = sig[cols, rows] = values[1]
+    np.fill_diagonal(corr, 1.0)
+    return (
+        pd.DataFrame(corr, index=columns, columns=columns),
+        pd.DataFrame(sig, index=columns, columns=columns),
+    )
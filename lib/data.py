@@ -0,0 +1,71 @@
+"""Process-wide access to the survey data.
+
+Streamlit executes the explorer script again on every interaction, but
+imported modules are only loaded once per server process. The survey data
+is therefore kept here and shared by all sessions. When the file on disk
+changes, the next access loads it and swaps the new version in as a whole,
+so a rerun that already holds a `Survey` keeps working with consistent data.
+"""
+
+import os
+import threading
+
+from lib.aggregate import filter_rows
+from lib.survey import load_survey
+
+_lock = threading.Lock()
+_surveys = {}
+
+
+def file_version(path):
+    """Return a token that changes whenever the file at `path` is replaced"""
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class Survey:
+    """One loaded version of the survey data.
+
+    The frame and its filtered views are shared between sessions and must
+    be treated as read-only.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.version = file_version(path)
+        self.df = load_survey(path)
+        self._views = {}
+        self._lock = threading.Lock()
+
+    def view(self, country="All", field="All"):
+        """Return the rows selected by the sidebar filters.
+
+        Each subset is materialised on first use and kept for this version.
+        """
+        key = (country, field)
+        if key not in self._views:
+            with self._lock:
+                if key not in self._views:
+                    if key == ("All", "All"):
+                        self._views[key] = self.df
+                    else:
+                        rows = filter_rows(self.df, country, field)
+                        self._views[key] = self.df.iloc[rows]
+        return self._views[key]
+
+
+def get_survey(path):
+    """Return the current `Survey` of the file at `path`.
+
+    The file is loaded once per process and again only when its modification
+    time or size has changed.
+    """
+    survey = _surveys.get(path)
+    if survey is not None and survey.version == file_version(path):
+        return survey
+    with _lock:
+        survey = _surveys.get(path)
+        if survey is None or survey.version != file_version(path):
+            survey = Survey(path)
+            _surveys[path] = survey
+    return survey
@@ -0,0 +1,92 @@
+"""Reading of the LimeSurvey exports.
+
+A full export holds several hundred columns, of which `scripts/clean.py`
+keeps about two hundred. The schema of an export lists the columns to keep
+with their dtypes and is passed to the reader, so that the other columns
+are never parsed. Answer codes and multiple choice answers are read as
+categoricals, so that each code is stored once per column instead of once
+per row. Exports are read from their compressed snapshots as a stream.
+"""
+
+import contextlib
+import csv
+import gzip
+
+import pandas as pd
+
+from lib.recode import RECODES
+from lib.snapshots import open_export
+
+# Columns holding answer codes, by their cleaned name
+CODED = {column for entry in RECODES for column in entry["columns"]}
+# Multiple choice answers are exported as "Y" or left empty
+MULTIPLE_CHOICE = (
+    "foi5[",
+    "attitude3",
+    "MShr3",
+    "MSsoc4",
+    "MSsoc5",
+    "MSimpact1",
+    "MSimpact2",
+)
+
+
+def export_schema(rename, columns):
+    """Return the dtypes of the exported columns to read, by exported name.
+
+    Open answers are read as text, whatever the rows at hand hold, so that
+    the rows of a delta read the same as those of the whole export;
+    clean.py turns those holding numbers into numbers.
+
+    Keyword arguments:
+    rename  -- mapping of exported column names to the names used in clean.py
+    columns -- the renamed columns to keep, with the two character prefix
+               that clean.py strips off
+    """
+    exported = {name: column for column, name in rename.items()}
+    schema = {}
+    for column in columns:
+        name = column[2:]
+        if name == "lastpage":
+            dtype = "float64"
+        elif name == "country" or name in CODED or name.startswith(MULTIPLE_CHOICE):
+            dtype = "category"
+        else:
+            dtype = "object"
+        schema[exported.get(column, column)] = dtype
+    return schema
+
+
+def read_export(path, rename, columns, offset=0):
+    """Read the `columns` of the LimeSurvey export at `path`.
+
+    Compressed exports are decompressed as they are read. The rows are
+    indexed by the id of their response.
+
+    Keyword arguments:
+    path    -- the CSV file exported from LimeSurvey, gzip compressed if it
+               ends in .gz
+    rename  -- mapping of exported column names to the names used in clean.py
+    columns -- the renamed columns to keep
+    offset  -- read only the rows from this byte of the file on, where a
+               row (or a gzip member) starts (Default value = 0)
+    """
+    schema = export_schema(rename, columns)
+    with contextlib.ExitStack() as stack:
+        file = stack.enter_context(open_export(path))
+        header = file.readline().decode("utf-8-sig").rstrip("\r\n")
+        if offset:
+            file = stack.enter_context(open(path, "rb"))
+            file.seek(offset)
+            if str(path).endswith(".gz"):
+                file = stack.enter_context(gzip.GzipFile(fileobj=file))
+        df = pd.read_csv(
+            file,
+            sep=";",
+            header=None,
+            names=next(csv.reader([header], delimiter=";")),
+            usecols=lambda column: column in schema or column == "id",
+            dtype=schema,
+            index_col="id",
+        )
+    return df.rename(columns=rename)
@@ -0,0 +1,402 @@
+"""Client of the LimeSurvey RemoteControl 2 API.
+
+Based on: https://manual.limesurvey.org/RemoteControl_2_API
+Documentation: https://api.limesurvey.org/classes/remotecontrol_handle.html
+
+A `RemoteControl` logs in once and keeps its session key until it is
+closed. Calls go through one `requests.Session`, which keeps the HTTP
+connections open, and may be made from several threads at once, so that
+all the exports of a refresh share a login and download concurrently.
+
+Exports are streamed to disk: the base64 encoded result is picked out of
+the JSON-RPC response and decoded as it arrives, so that an export is never
+held in memory, whatever its size.
+
+Only the fields asked for are exported. Fields are named after the ids of
+their survey, group and question, which `survey_columns` looks up by the
+column headings from the questions of the survey.
+"""
+
+import base64
+import csv
+import json
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from lib.snapshots import open_export
+
+ENDPOINT = "{}/index.php/admin/remotecontrol"
+# Statuses of exports without any responses
+NO_RESPONSES = ("No Response found", "No Data, could not get maximum id")
+# Columns of the exports that are not questions, whose fields are named like
+# their headings
+BASE_FIELDS = (
+    "id",
+    "token",
+    "submitdate",
+    "lastpage",
+    "startlanguage",
+    "seed",
+    "startdate",
+    "datestamp",
+    "ipaddr",
+    "refurl",
+)
+# Start of the result of a JSON-RPC response, up to its first character
+RESULT = re.compile(rb'"result"\s*:\s*(\S)')
+CHUNK_SIZE = 1 << 16
+# Returned by _write_result when the result was a string, written to the file
+_STREAMED = object()
+
+
+def _sibling(path, suffix):
+    """Return `path` with `suffix` added, before .gz if it is compressed"""
+    path = str(path)
+    if path.endswith(".gz"):
+        return f"{path[:-3]}{suffix}.gz"
+    return f"{path}{suffix}"
+
+
+class _Base64Writer:
+    """Decodes base64 text fed in pieces and writes it to a binary file"""
+
+    def __init__(self, file):
+        self.file = file
+        self.pending = b""
+        self.first = True
+        self.last = b""
+
+    def feed(self, data):
+        data = self.pending + data
+        # JSON may escape the slashes of base64, and an escape may be split
+        # between two pieces
+        if data.endswith(b"\\"):
+            data, self.pending = data[:-1], b"\\"
+        else:
+            self.pending = b""
+        data = data.replace(b"\\/", b"/")
+        usable = len(data) - len(data) % 4
+        self.pending = data[usable:] + self.pending
+        self._write(base64.b64decode(data[:usable]))
+
+    def close(self):
+        self._write(base64.b64decode(self.pending))
+        # Rows can be appended to exports that end with a newline
+        if self.last != b"\n":
+            self.file.write(b"\n")
+
+    def _write(self, data):
+        if not data:
+            return
+        if self.first:
+            self.first = False
+            data = data.removeprefix(b"\xef\xbb\xbf")
+        self.file.write(data)
+        self.last = data[-1:] or self.last
+
+
+def _result(response):
+    """Return the result of the JSON-RPC `response`.
+
+    Raises ValueError if the call failed: if the response has an error,
+    no result or a status as its result.
+    """
+    result = response.get("result")
+    if response.get("error") is not None:
+        raise ValueError(response["error"])
+    if isinstance(result, dict) and "status" in result:
+        raise ValueError(result["status"])
+    if result is None:
+        raise ValueError("The response has no result")
+    return result
+
+
+def _write_result(chunks, file):
+    """Decode the result of the JSON-RPC response `chunks` to `file`.
+
+    Returns _STREAMED if the result was a string, and the response instead
+    otherwise, e.g. if its result is a status.
+    """
+    chunks = iter(chunks)
+    head = b""
+    for chunk in chunks:
+        head += chunk
+        match = RESULT.search(head)
+        if match:
+            break
+    else:
+        return json.loads(head)
+    if match.group(1) != b'"':
+        return json.loads(head + b"".join(chunks))
+    writer = _Base64Writer(file)
+    data = head[match.end() :]
+    # base64 has no quotes, so the string ends at the next one
+    while (end := data.find(b'"')) < 0:
+        writer.feed(data)
+        data = next(chunks, None)
+        if data is None:
+            raise ValueError("The export ended unexpectedly")
+    writer.feed(data[:end])
+    writer.close()
+    return _STREAMED
+
+
+class RemoteControl:
+    """A session of the RemoteControl 2 API, to be used as a context manager"""
+
+    def __init__(self, base_url, user_name, password, user_id, pool_size=4):
+        """Keyword arguments:
+        base_url  -- e.g. https://mywebsite.nl/survey
+        user_name -- LimeSurvey user name
+        password  -- LimeSurvey user password
+        user_id   -- LimeSurvey user id
+        pool_size -- number of HTTP connections kept open (Default value = 4)
+        """
+        self.api_url = ENDPOINT.format(base_url)
+        self.user_name = user_name
+        self.password = password
+        self.user_id = user_id
+        self.session_key = None
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+
+    def call(self, method, *params):
+        """Call the API `method` with `params` and return its result"""
+        payload = {"method": method, "params": list(params), "id": self.user_id}
+        response = self.http.post(self.api_url, json=payload)
+        response.raise_for_status()
+        return _result(response.json())
+
+    def __enter__(self):
+        self.session_key = self.call("get_session_key", self.user_name, self.password)
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            self.call("release_session_key", self.session_key)
+        finally:
+            self.session_key = None
+            self.http.close()
+
+    def export_responses(
+        self,
+        path,
+        sid,
+        lang=None,
+        document_type="csv",
+        completion_status="all",
+        heading_type="code",
+        response_type="short",
+        from_response_id=None,
+        to_response_id=None,
+        fields=None,
+    ):
+        """Export the responses to the survey `sid` to the file at `path`.
+
+        The export is written to disk as it arrives, gzip compressed if
+        `path` ends in .gz. The file is only replaced once the export is
+        complete.
+
+        Keyword arguments:
+        path              -- the file to write the export to
+        sid               -- LimeSurvey survey id
+        lang              -- language (Default value = None)
+        document_type     -- format for results (Default value = "csv")
+        completion_status -- which responses to export, "complete",
+                             "incomplete" or "all" (Default value = "all")
+        heading_type      -- "code", "full" or "abbreviated"
+                             (Default value = "code")
+        response_type     -- "short" or "long" (Default value = "short")
+        from_response_id  -- for partial export (Default value = None)
+        to_response_id    -- for partial export (Default value = None)
+        fields            -- for partial export (Default value = None)
+        """
+        params = [
+            self.session_key,
+            sid,
+            document_type,
+            lang,
+            completion_status,
+            heading_type,
+            response_type,
+            from_response_id,
+            to_response_id,
+            fields,
+        ]
+        payload = {"method": "export_responses", "params": params, "id": self.user_id}
+        part = _sibling(path, ".part")
+        with self.http.post(self.api_url, json=payload, stream=True) as response:
+            response.raise_for_status()
+            with open_export(part, "wb") as file:
+                result = _write_result(response.iter_content(CHUNK_SIZE), file)
+        if result is not _STREAMED:
+            os.remove(part)
+            # An export is a string, anything else means it failed
+            raise ValueError(f"The export failed: {_result(result)!r}")
+        os.replace(part, path)
+
+
+def _stored_responses(path):
+    """Return the responses in the export at `path`, the latest of each id"""
+    df = pd.read_csv(path, sep=";", dtype=str, keep_default_na=False)
+    df = df.drop_duplicates("id", keep="last")
+    return df.set_index(df["id"].astype(int)).sort_index()
+
+
+def _response_mark(responses):
+    """Return the id after which responses may have changed, or None.
+
+    Responses that were not submitted yet may still be answered, so the
+    mark is the id before the first of those, and the highest id if all
+    were submitted. There is no mark without the submit dates.
+    """
+    if responses.empty or "submitdate" not in responses:
+        return None
+    ongoing = responses.index[responses["submitdate"] == ""]
+    return int(ongoing.min()) - 1 if len(ongoing) else int(responses.index.max())
+
+
+def _columns(header):
+    return next(csv.reader([header.decode("utf-8-sig").rstrip("\r\n")], delimiter=";"))
+
+
+def _append_rows(path, export, target):
+    """Write the export at `path` with the rows of `export` appended to `target`.
+
+    The stored bytes of `path` are copied as they are, so that a compressed
+    export gets the rows as another gzip member. Returns False, writing
+    nothing, if the columns differ.
+    """
+    with open_export(path) as stored, open_export(export) as rows:
+        if _columns(stored.readline()) != _columns(rows.readline()):
+            return False
+        part = _sibling(target, ".part")
+        shutil.copyfile(path, part)
+        with open_export(part, "ab") as file:
+            shutil.copyfileobj(rows, file)
+    os.replace(part, target)
+    return True
+
+
+def download_exports(client, exports, workers=4, previous=None):
+    """Download `exports` over the open `client`, `workers` at a time.
+
+    With `previous`, the exports are updated instead: only the responses
+    after the last one in the previous export are downloaded, along with
+    those that were not submitted yet, and written as the previous export
+    with them appended. Responses downloaded again thus appear more than
+    once, the latest last. An export is downloaded in full if it has no
+    previous export, or if the columns of the survey changed, and not
+    written at all if no response is new or changed.
+
+    Returns the paths of the exports that were written.
+
+    Keyword arguments:
+    client   -- an open RemoteControl
+    exports  -- mapping of paths to write to the keyword arguments of
+                `RemoteControl.export_responses`
+    workers  -- number of exports downloaded at once (Default value = 4)
+    previous -- mapping of paths to the previous exports, which may be the
+                paths themselves (Default value = None)
+    """
+
+    def download(path):
+        source = (previous or {}).get(path)
+        stored = None if source is None else _stored_responses(source)
+        mark = None if stored is None else _response_mark(stored)
+        if mark is not None:
+            delta = _sibling(path, ".delta")
+            try:
+                client.export_responses(
+                    delta, **exports[path], from_response_id=mark + 1
+                )
+            except ValueError as error:
+                # LimeSurvey answers with a status if there is nothing to export
+                if str(error).startswith(NO_RESPONSES):
+                    return None
+                raise
+            try:
+                rows = _stored_responses(delta)
+                if rows.equals(stored.loc[mark + 1 :]):
+                    return None
+                if _append_rows(source, delta, path):
+                    return path
+            finally:
+                os.remove(delta)
+        client.export_responses(path, **exports[path])
+        return path
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return [path for path in pool.map(download, exports) if path is not None]
+
+
+# ===========================================================================
+# Survey metadata
+# ===========================================================================
+
+
+def _is_subquestion(question):
+    return str(question["parent_qid"]) != "0"
+
+
+def survey_columns(questions):
+    """Describe the columns of the exports of a survey, by their heading.
+
+    Every column is described by the name of its field, which is what
+    `export_responses` expects in `fields`, the id of its question (None for
+    the columns that are not questions) and its text, as in the headings
+    of the "full" heading type.
+
+    Keyword arguments:
+    questions -- the questions of the survey, as returned by list_questions
+    """
+    columns = {
+        field: {"field": field, "qid": None, "text": field} for field in BASE_FIELDS
+    }
+    parents = {q["qid"]: q for q in questions if not _is_subquestion(q)}
+    for question in parents.values():
+        field = f"{question['sid']}X{question['gid']}X{question['qid']}"
+        text = question["question"]
+        columns[question["title"]] = {
+            "field": field,
+            "qid": question["qid"],
+            "text": text,
+        }
+        columns[f"{question['title']}[other]"] = {
+            "field": f"{field}other",
+            "qid": question["qid"],
+            "text": f"{text} [Other]",
+        }
+    for question in questions:
+        if _is_subquestion(question):
+            parent = parents[question["parent_qid"]]
+            columns[f"{parent['title']}[{question['title']}]"] = {
+                "field": (
+                    f"{parent['sid']}X{parent['gid']}X{parent['qid']}"
+                    f"{question['title']}"
+                ),
+                "qid": parent["qid"],
+                "text": f"{parent['question']} [{question['question']}]",
+            }
+    return columns
+
+
+def export_fields(columns, headings):
+    """Return the fields to export for the columns `headings`.
+
+    Keyword arguments:
+    columns  -- the columns of the survey, as returned by `survey_columns`
+    headings -- the headings of the columns to export
+    """
+    missing = [heading for heading in headings if heading not in columns]
+    if missing:
+        raise ValueError(f"The survey has no columns {missing}")
+    return [columns[heading]["field"] for heading in headings]
@@ -0,0 +1,272 @@
+"""Compact on-disk store of the correlation and significance matrices.
+
+Both matrices of a dataframe are symmetric and share their columns, so only
+their upper triangles (diagonal included, row by row) are stored, as float32
+.npy files, next to the names of the columns, stored once as JSON:
+
+    data/corr_sig/merged_columns.json
+    data/corr_sig/merged_corr.npy
+    data/corr_sig/merged_sig.npy
+
+The triangles are memory-mapped rather than read, so looking up the values
+of some pairs of columns only touches those pages of the files. CSV and Excel
+copies of a matrix are only written on demand, by `export_matrix`.
+
+An index of the strongest associations answers "what correlates with X"
+without the matrices: for every column its TOP_K partners with the highest
+φk, those with a significance of at least MIN_SIGNIFICANCE first
+(`merged_top.npy`, one row per column), and every pair of columns with such
+a significance, strongest first (`merged_pairs.npy`). Both refer to the
+columns by their positions. Sparse columns with mostly distinct answers
+reach a φk of 1 with about any other column, so open answers are left out
+of the index (see `open_answers`).
+
+There are matrices for every sidebar filter combination of the explorer:
+those of the dataframes of each field (see FIELD_FRAMES) and those of their
+rows of each country, e.g. `media_germany_corr.npy`; see `filter_name`.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DIRECTORY = "data/corr_sig"
+KINDS = ["corr", "sig"]
+EXPORTS = ["csv", "xlsx"]
+# Dataframes written by scripts/clean.py's split per field filter
+FIELD_FRAMES = {"All": "merged", "Journalists": "media", "CSO Professionals": "civsoc"}
+# Partners indexed per column
+TOP_K = 20
+# Distinct answers above which a column of text is taken for open answers;
+# the scales of the survey have at most 7
+MAX_LEVELS = 12
+# Z-score of the significance above which pairs are listed (p < 0.0014)
+MIN_SIGNIFICANCE = 3.0
+# Records of the index, positions of columns (-1 if none) and their values
+TOP_DTYPE = np.dtype([("partner", "<i4"), ("corr", "<f4"), ("sig", "<f4")])
+PAIR_DTYPE = np.dtype([("x", "<i4"), ("y", "<i4"), ("corr", "<f4"), ("sig", "<f4")])
+
+
+def matrices_name(frame, country="All"):
+    """Return the name of the matrices of the rows of `frame` from `country`"""
+    if country == "All":
+        return frame
+    return f"{frame}_{country.lower().replace(' ', '_')}"
+
+
+def filter_name(country="All", field="All"):
+    """Return the name of the matrices of a sidebar filter combination"""
+    return matrices_name(FIELD_FRAMES[field], country)
+
+
+def columns_path(frame, directory=DIRECTORY):
+    return str(Path(directory, f"{frame}_columns.json"))
+
+
+def matrix_path(frame, kind, ext="npy", directory=DIRECTORY):
+    return str(Path(directory, f"{frame}_{kind}.{ext}"))
+
+
+def index_path(frame, kind, directory=DIRECTORY):
+    return str(Path(directory, f"{frame}_{kind}.npy"))
+
+
+def store_paths(frame, directory=DIRECTORY):
+    """Return the paths of all files of the store of `frame`"""
+    return (
+        [columns_path(frame, directory)]
+        + [matrix_path(frame, kind, directory=directory) for kind in KINDS]
+        + [index_path(frame, kind, directory) for kind in ["top", "pairs"]]
+    )
+
+
+def is_stored(frame, directory=DIRECTORY):
+    """Return whether the matrices and the index of `frame` are stored"""
+    return all(Path(path).exists() for path in store_paths(frame, directory))
+
+
+def is_indexed(frame, directory=DIRECTORY):
+    """Return whether the index of `frame` is stored, as in the Docker image,
+    which does not ship the matrices"""
+    paths = [columns_path(frame, directory)] + [
+        index_path(frame, kind, directory) for kind in ["top", "pairs"]
+    ]
+    return all(Path(path).exists() for path in paths)
+
+
+def triangle_index(n, i, j):
+    """Return the position of the value (`i`, `j`) in the triangle of an n×n
+    matrix (works on arrays of positions, too)"""
+    i, j = np.minimum(i, j), np.maximum(i, j)
+    return i * n - i * (i - 1) // 2 + j - i
+
+
+def save_matrices(frame, corr, sig, directory=DIRECTORY):
+    """Store the matrices `corr` and `sig` of `frame`.
+
+    Keyword arguments:
+    frame     -- the name of the dataframe, e.g. "merged"
+    corr, sig -- symmetric DataFrames with the same index and columns
+    directory -- where to store them (Default value = DIRECTORY)
+    """
+    if not (corr.columns.equals(sig.columns) and corr.index.equals(corr.columns)):
+        raise ValueError("The matrices must share their index and columns")
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    rows, cols = np.triu_indices(len(corr.columns))
+    for kind, matrix in zip(KINDS, [corr, sig]):
+        triangle = matrix.to_numpy()[rows, cols].astype(np.float32)
+        np.save(matrix_path(frame, kind, directory=directory), triangle)
+    with open(columns_path(frame, directory), "w") as file:
+        json.dump(list(corr.columns), file, ensure_ascii=False)
+
+
+def load_columns(frame, directory=DIRECTORY):
+    with open(columns_path(frame, directory)) as file:
+        return pd.Index(json.load(file))
+
+
+def load_triangle(frame, kind, directory=DIRECTORY):
+    """Return the memory-mapped triangle of the matrix `kind` of `frame`"""
+    return np.load(matrix_path(frame, kind, directory=directory), mmap_mode="r")
+
+
+def load_matrix(frame, kind, directory=DIRECTORY):
+    """Return the matrix `kind` ("corr" or "sig") of `frame` as a DataFrame"""
+    columns = load_columns(frame, directory)
+    triangle = load_triangle(frame, kind, directory)
+    rows, cols = np.triu_indices(len(columns))
+    matrix = np.empty((len(columns), len(columns)), dtype=np.float32)
+    matrix[rows, cols] = matrix[cols, rows] = triangle
+    return pd.DataFrame(matrix, index=columns, columns=columns)
+
+
+def export_matrix(frame, kind, ext, directory=DIRECTORY):
+    """Write a CSV or Excel copy of a matrix, unless an up to date one exists.
+
+    Returns the path of the copy.
+
+    Keyword arguments:
+    frame     -- the name of the dataframe, e.g. "merged"
+    kind      -- "corr" or "sig"
+    ext       -- "csv" or "xlsx"
+    directory -- where the matrices are stored (Default value = DIRECTORY)
+    """
+    if ext not in EXPORTS:
+        raise ValueError(f"Cannot export a matrix to {ext}")
+    path = Path(matrix_path(frame, kind, ext, directory))
+    source = Path(matrix_path(frame, kind, directory=directory))
+    if path.exists() and path.stat().st_mtime >= source.stat().st_mtime:
+        return str(path)
+    matrix = load_matrix(frame, kind, directory)
+    if ext == "csv":
+        matrix.to_csv(path)
+    else:
+        matrix.to_excel(path)
+    return str(path)
+
+
+# ===========================================================================
+# Index of the strongest associations
+# ===========================================================================
+
+
+def open_answers(df, max_levels=MAX_LEVELS):
+    """Return the columns of `df` that hold text with many distinct answers"""
+    return [
+        column
+        for column, values in df.items()
+        if not (pd.api.types.is_numeric_dtype(values) or values.dtype == bool)
+        and values.nunique() > max_levels
+    ]
+
+
+def save_index(frame, corr, sig, k=TOP_K, exclude=(), directory=DIRECTORY):
+    """Store the index of the strongest associations of `frame`.
+
+    Keyword arguments:
+    frame     -- the name of the dataframe, e.g. "merged"
+    corr, sig -- the matrices, as passed to `save_matrices`
+    k         -- partners indexed per column (Default value = TOP_K)
+    exclude   -- columns left out of the index, e.g. `open_answers`
+                 (Default value = ())
+    directory -- where to store it (Default value = DIRECTORY)
+    """
+    n = len(corr.columns)
+    values = corr.to_numpy(dtype=np.float64, copy=True)
+    significance = sig.to_numpy(dtype=np.float64)
+    np.fill_diagonal(values, np.nan)
+    excluded = corr.columns.isin(exclude)
+    values[excluded, :] = values[:, excluded] = np.nan
+    # Significant partners first, each strongest first, columns without a
+    # value last, ties in column order. φk is at most 1
+    score = np.where(significance >= MIN_SIGNIFICANCE, values + 2, values)
+    order = np.argsort(-np.nan_to_num(score, nan=-np.inf), axis=1, kind="stable")
+    order = order[:, : min(k, max(n - 1, 0))]
+    rows = np.arange(n)[:, None]
+    top = np.empty(order.shape, dtype=TOP_DTYPE)
+    top["corr"] = values[rows, order]
+    top["sig"] = significance[rows, order]
+    top["partner"] = np.where(np.isnan(top["corr"]), -1, order)
+    np.save(index_path(frame, "top", directory), top)
+
+    x, y = np.triu_indices(n, 1)
+    listed = (significance[x, y] >= MIN_SIGNIFICANCE) & ~np.isnan(values[x, y])
+    x, y = x[listed], y[listed]
+    order = np.argsort(-values[x, y], kind="stable")
+    pairs = np.empty(order.size, dtype=PAIR_DTYPE)
+    pairs["x"], pairs["y"] = x[order], y[order]
+    pairs["corr"] = values[pairs["x"], pairs["y"]]
+    pairs["sig"] = significance[pairs["x"], pairs["y"]]
+    np.save(index_path(frame, "pairs", directory), pairs)
+
+
+def indexed_columns(frame, directory=DIRECTORY):
+    """Return the columns of `frame` with partners in the index"""
+    columns = load_columns(frame, directory)
+    top = np.load(index_path(frame, "top", directory), mmap_mode="r")
+    return columns[(top["partner"] >= 0).any(axis=1)] if top.size else columns[:0]
+
+
+def associated_with(frame, column, min_significance=None, directory=DIRECTORY):
+    """Return the strongest partners of `column` in `frame`, significant ones
+    first, each strongest first.
+
+    Returns a DataFrame with the name, the φk value and the significance of
+    every partner.
+
+    Keyword arguments:
+    frame            -- the name of the dataframe, e.g. "merged"
+    column           -- the name of the column
+    min_significance -- leave out less significant partners, none if None
+                        (Default value = None)
+    directory        -- where the index is stored (Default value = DIRECTORY)
+    """
+    columns = load_columns(frame, directory)
+    top = np.load(index_path(frame, "top", directory), mmap_mode="r")
+    top = top[columns.get_loc(column)]
+    top = top[top["partner"] >= 0]
+    if min_significance is not None:
+        top = top[top["sig"] >= min_significance]
+    return pd.DataFrame(
+        {"column": columns[top["partner"]], "corr": top["corr"], "sig": top["sig"]}
+    )
+
+
+def strongest_pairs(frame, n=None, directory=DIRECTORY):
+    """Return the `n` strongest significant pairs of columns of `frame`.
+
+    Returns a DataFrame with the names of both columns, the φk value and the
+    significance of every pair, strongest first; all pairs if `n` is None.
+    """
+    columns = load_columns(frame, directory)
+    pairs = np.load(index_path(frame, "pairs", directory), mmap_mode="r")[:n]
+    return pd.DataFrame(
+        {
+            "x": columns[pairs["x"]],
+            "y": columns[pairs["y"]],
+            "corr": pairs["corr"],
+            "sig": pairs["sig"],
+        }
+    )
@@ -0,0 +1,77 @@
+"""A small runner for the data pipeline.
+
+The pipeline is a DAG of stages. A stage names a function (as
+"module:function") and its arguments, and lists the stages whose outputs
+it reads. Stages pass their results on through files, so each one runs in
+a worker process as soon as the stages it comes after are done, and
+independent stages run at the same time.
+"""
+
+import importlib
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+
+def stage(target, *args, after=()):
+    """Return a stage calling `target` ("module:function") with `args`.
+
+    Keyword arguments:
+    target -- the function to call, as "module:function"
+    args   -- the arguments to call it with
+    after  -- names of the stages that must be done first (Default value = ())
+    """
+    return {"target": target, "args": args, "after": list(after)}
+
+
+def _run(target, args):
+    """Call `target` with `args` and return its wall time in seconds"""
+    module, function = target.split(":")
+    start = time.perf_counter()
+    getattr(importlib.import_module(module), function)(*args)
+    return time.perf_counter() - start
+
+
+def _required(stages, targets):
+    """Return the names of `targets` and of all the stages they come after"""
+    required = set()
+    pending = list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in required:
+            required.add(name)
+            pending += stages[name]["after"]
+    return required
+
+
+def run_pipeline(stages, targets=None, skip=(), workers=None, report=print):
+    """Run the `stages` needed for `targets`, independent stages in parallel.
+
+    Returns the wall time of every stage that was run, in seconds.
+
+    Keyword arguments:
+    stages  -- mapping of stage names to stages (see `stage`)
+    targets -- names of the stages to run; all if None (Default value = None)
+    skip    -- names of stages to treat as done (Default value = ())
+    workers -- number of worker processes (Default value = None)
+    report  -- called with a line of text whenever a stage is done
+    """
+    names = _required(stages, targets or stages) - set(skip)
+    waiting = {name: set(stages[name]["after"]) & names for name in names}
+    running = {}
+    timings = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while waiting or running:
+            for name in [name for name, after in waiting.items() if not after]:
+                del waiting[name]
+                future = pool.submit(_run, stages[name]["target"], stages[name]["args"])
+                running[future] = name
+            if not running:
+                raise ValueError(f"Stages depend on each other: {sorted(waiting)}")
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                timings[name] = future.result()
+                report(f"{name:<30} {timings[name]:8.2f}s")
+                for after in waiting.values():
+                    after.discard(name)
+    return timings
@@ -0,0 +1,1229 @@
+"""The questions shown by the explorer, as data.
+
+Every question of the explorer is described by one entry of QUESTIONS, in the
+order it is shown. An entry names the question code, the section and topic it
+belongs to, who it was put to and the kind of chart drawing it, together with
+the options, labels and colours of that chart. explorer.py renders the
+sections from these entries, and scripts can walk them to build, export or
+time every chart.
+
+Keys of an entry:
+section  -- title of the section in the sidebar
+topic    -- heading shown above the first question of a topic (optional)
+code     -- the question code, also the column (stem) in the survey data
+title    -- the question as shown in the heading, None for a chart without one
+details  -- text shown below the heading (optional)
+note     -- caption shown below the chart (optional)
+audience -- "cso" or "media" if the question was only put to one group
+chart    -- kind of the chart, see below
+total    -- how the number of respondents is counted, see below
+
+Kinds of charts and their keys:
+pie        -- answer counts as a pie; `colors` maps answers to palette indices
+scale_pie  -- answer counts ordered by their position on the answer scale;
+              `missing` lists answers shown even if nobody gave them and
+              `style` is passed on to the figure
+numeric    -- histogram and box plot of a number; `label` names the axis,
+              `box_label` the axis of the box plot if it differs, `nbins`
+              the number of bins and `box` whether to draw the box plot
+split      -- pie of the number in `column` being above `threshold`, drawn
+              with the two `labels` (above, at most)
+choices    -- multiple choice `options` with their `labels`, counted per
+              country; `y_label` names the axis
+likert     -- answers to several `options` (shown as `labels`) stacked as
+              `bars`, given as (answer, palette index[, opacity])
+ranking    -- the ranking of the `options`
+custom     -- drawn by the function of the explorer named in `render`
+
+Totals:
+sum         -- number of answers to the question (the default)
+respondents -- respondents who chose at least one of the options
+selections  -- number of options chosen by all respondents
+answered    -- respondents who answered at least one of the options
+max         -- answers to the option answered most often
+None        -- no total is shown
+"""
+
+# ===========================================================================
+# Shared options and colours
+# ===========================================================================
+
+COUNTRY_COLORS = {"Germany": 0, "France": 2, "United Kingdom": 5}
+COUNTRY_COLORS_ALT = {"Germany": 0, "United Kingdom": 2, "France": 5}
+
+YES_NO_COLORS = {"No": 0, "Yes": 2, "I don't know": 4, "I prefer not to say": 5}
+YES_NO_COLORS_ALT = {"No": 0, "Yes": 2, "I don't know": 5, "I prefer not to say": 4}
+
+IMPORTANCE_BARS = [
+    ("Very important", 0),
+    ("Somewhat important", 1),
+    ("Important", 2),
+    ("Slightly important", 3),
+    ("Not important at all", 5),
+]
+AGREEMENT_BARS = [
+    ("Agree completely", 0),
+    ("Agree to a great extent", 1),
+    ("Agree somewhat", 2),
+    ("Agree slightly", 3),
+    ("Not agree at all", 5),
+]
+YES_NO_BARS = [
+    ("Yes", 2),
+    ("No", 0),
+    ("I don't know", 4),
+    ("I prefer not to say", 5),
+]
+YES_NO_BARS_ALT = [
+    ("Yes", 2),
+    ("No", 0),
+    ("I don't know", 5),
+    ("I prefer not to say", 4),
+]
+YES_NO_BARS_FADED = [
+    ("Yes", 2),
+    ("No", 0),
+    ("I don't know", 4, 0.8),
+    ("I prefer not to say", 5, 0.8),
+]
+
+ATTITUDE_STYLE = {
+    "height": 600,
+    "font_size": 13,
+    "legend_font_size": 11,
+    "legend_x": -0.75,
+    "legend_y": 1.5,
+    "image_sizex": 0.25,
+    "image_sizey": 0.25,
+}
+OVERSIGHT_BODIES = [
+    "Parliamentary oversight bodies",
+    "Judicial oversight bodies",
+    "Independent expert bodies",
+    "Data protection authorities",
+    "Audit courts",
+    "CSOs | The media",
+]
+
+# ===========================================================================
+# Sections
+# ===========================================================================
+
+# Captions shown at the top of a section, and the functions of the explorer
+# rendering its introduction
+SECTION_HEADERS = {
+    "Overview": {"intro": "overview"},
+    "Resources > HR": {},
+    "Resources > Expertise": {},
+    "Resources > Finance": {},
+    "Resources > FOI": {},
+    "Resources > Appreciation": {},
+    "Media Reporting": {
+        "note": "__NB__: All questions in this section have only been presented to Journalists."
+    },
+    "Public Campaigning": {
+        "note": "__NB__: All questions in this section have only been presented to civil society professionals."
+    },
+    "Policy Advocacy": {
+        "note": "__NB__: All questions in this section have only been presented to civil society organisation professionals."
+    },
+    "Strategic Litigation": {
+        "note": "__NB__: All questions in this section have only been presented to civil society organisation professionals."
+    },
+    "Protection": {},
+    "Constraints": {},
+    "Attitudes": {},
+    "Associations": {"intro": "associations"},
+}
+
+# ===========================================================================
+# Questions
+# ===========================================================================
+
+QUESTIONS = [
+    # Overview
+    {
+        "section": "Overview",
+        "code": "country",
+        "title": "Country",
+        "chart": "pie",
+        "colors": COUNTRY_COLORS,
+    },
+    {
+        "section": "Overview",
+        "code": "field",
+        "title": "Field",
+        "chart": "pie",
+    },
+    {
+        "section": "Overview",
+        "code": "CSpreselection",
+        "title": "Predominant activity of CSO professionals",
+        "chart": "pie",
+    },
+    {
+        "section": "Overview",
+        "code": "gender",
+        "title": "Gender",
+        "chart": "pie",
+        "colors": {"Not specified": 0, "Male": 1, "Female": 2, "Other": 3},
+    },
+    # Resources > HR
+    {
+        "section": "Resources > HR",
+        "topic": "Resources > HR",
+        "code": "hr1",
+        "title": "What is your employment status?",
+        "chart": "pie",
+        "colors": {
+            "Full-time": 0,
+            "Part-time (>50%)": 1,
+            "Part-time (<50%)": 2,
+            "Freelance": 3,
+            "Other": 4,
+        },
+    },
+    {
+        "section": "Resources > HR",
+        "code": "hr2",
+        "title": "How many days per month do you work on surveillance by intelligence agencies?",
+        "chart": "numeric",
+        "label": "days per month",
+        "nbins": None,
+    },
+    {
+        "section": "Resources > HR",
+        "code": "hr2_more_than_five",
+        "title": None,
+        "chart": "split",
+        "column": "hr2",
+        "threshold": 5,
+        "labels": ["more than 5 days", "5 days or less"],
+        "total": None,
+    },
+    {
+        "section": "Resources > HR",
+        "code": "MShr3",
+        "title": "Which type of medium do you work for?",
+        "audience": "media",
+        "chart": "choices",
+        "options": [
+            "daily_newspaper",
+            "weekly_newspaper",
+            "magazine",
+            "tv",
+            "radio",
+            "news_agency",
+            "online_stand_alone",
+            "online_of_offline",
+        ],
+        "labels": [
+            "Daily newspaper",
+            "Weekly newspaper",
+            "Magazine",
+            "TV",
+            "Radio",
+            "News agency",
+            "Online outlet<br>(standalone)",
+            "Online outlet<br>(of an offline publication)",
+        ],
+        "y_label": "people who work<br>for this medium",
+        "country_colors": COUNTRY_COLORS_ALT,
+        "total": "respondents",
+    },
+    {
+        "section": "Resources > HR",
+        "code": "MShr4",
+        "title": "Within the past year, did you have enough time to cover surveillance by intelligence agencies?",
+        "audience": "media",
+        "chart": "scale_pie",
+    },
+    # Resources > Expertise
+    {
+        "section": "Resources > Expertise",
+        "topic": "Resources > Expertise",
+        "code": "expertise1",
+        "title": "How many years have you spent working on surveillance by intelligence agencies?",
+        "chart": "numeric",
+        "label": "years",
+        "nbins": 20,
+    },
+    {
+        "section": "Resources > Expertise",
+        "code": "expertise2",
+        "title": "How do you assess your level of expertise concerning the **legal** aspects of surveillance by intelligence agencies?",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Resources > Expertise",
+        "code": "expertise3",
+        "title": "How do you assess your level of expertise concerning the **political** aspects of surveillance by intelligence agencies?",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Resources > Expertise",
+        "code": "expertise4",
+        "title": "How do you assess your level of expertise concerning the **technical** aspects of surveillance by intelligence agencies?",
+        "chart": "scale_pie",
+    },
+    # Resources > Finance
+    {
+        "section": "Resources > Finance",
+        "topic": "Resources > Finance",
+        "code": "finance1",
+        "title": "How do you assess the financial resources that have been available for your work on intelligence over the past 5 years?",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Resources > Finance",
+        "code": "MSfinance2",
+        "title": "If you wanted to conduct investigative research into surveillance by intelligence agencies, could you access extra funding for this research? (For example, a special budget or a stipend)",
+        "audience": "media",
+        "chart": "pie",
+        "colors": YES_NO_COLORS,
+    },
+    {
+        "section": "Resources > Finance",
+        "code": "CSfinance2",
+        "title": "How important are the following funding categories for your organisation's work on intelligence-related issues?",
+        "audience": "cso",
+        "chart": "likert",
+        "options": [
+            "private_foundations",
+            "donations",
+            "national_public_funds",
+            "corporate_sponsorship",
+            "international_public_funds",
+            "other",
+        ],
+        "labels": [
+            "Private foundations",
+            "Donations",
+            "National public funds",
+            "Corporate sponsorships",
+            "International public funds",
+            "Other",
+        ],
+        "bars": [
+            ("Very important", 0),
+            ("Somewhat important", 1),
+            ("Important", 2),
+            ("Slightly important", 3),
+            ("Not important at all", 4),
+            ("I prefer not to say", 5),
+        ],
+        "total": "max",
+    },
+    # Resources > FOI
+    {
+        "section": "Resources > FOI",
+        "topic": "Resources > FOI",
+        "code": "foi1",
+        "title": "Have you requested information under the national FOI† law when you worked on intelligence-related issues over the past 5 years?",
+        "note": "†Freedom of Information",
+        "chart": "pie",
+        "colors": {"No": 0, "Yes": 3, "I don't know": 4, "I prefer not to say": 5},
+    },
+    {
+        "section": "Resources > FOI",
+        "code": "foi2",
+        "title": "How often did you request information?",
+        "chart": "numeric",
+        "label": "Number of requests",
+        "nbins": 10,
+    },
+    {
+        "section": "Resources > FOI",
+        "code": "foi3",
+        "title": "Over the past 5 years, did you receive a response to your FOI request(s) in a timely manner?",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Resources > FOI",
+        "code": "foi4",
+        "title": "How helpful have Freedom of Information requests been for your work on intelligence-related issues?",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Resources > FOI",
+        "code": "foi5",
+        "title": "Why haven’t you requested information under the national FOI law when you reported on intelligence-related issues over the past 5 years?",
+        "chart": "choices",
+        "options": [
+            "not_aware",
+            "not_covered",
+            "too_expensive",
+            "too_time_consuming",
+            "afraid_of_data_destruction",
+            "afraid_of_discrimination",
+            "other",
+            "dont_know",
+            "prefer_not_to_say",
+        ],
+        "labels": [
+            "I was not aware",
+            "The authority was not covered<br>by FOI law",
+            "It seemed to expensive",
+            "It seemed to time-consuming",
+            "I was afraid the request<br>could lead to data destruction",
+            "afraid_of_discrimination",
+            "Other",
+            "I don't know ",
+            "I prefer not to say",
+        ],
+        "y_label": "people who answered 'Yes'",
+        "font_size": 11,
+        "total": "selections",
+    },
+    # Resources > Appreciation
+    {
+        "section": "Resources > Appreciation",
+        "topic": "Resources > Appreciation",
+        "code": "MSapp1",
+        "title": "In the past 5 years, have stories on surveillance by intelligence agencies been nominated for a journalistic award in the country you primarily work in?",
+        "audience": "media",
+        "chart": "pie",
+        "colors": YES_NO_COLORS,
+    },
+    {
+        "section": "Resources > Appreciation",
+        "code": "MSapp2",
+        "title": "Are there specific awards in the country you primarily work in for reporting on intelligence-related topics?",
+        "audience": "media",
+        "chart": "pie",
+        "colors": YES_NO_COLORS,
+    },
+    # Media Reporting
+    {
+        "section": "Media Reporting",
+        "topic": "Scope of Coverage",
+        "code": "MSsoc1",
+        "title": "Please estimate: how many journalistic pieces have you produced on intelligence-related topics in the past year?",
+        "audience": "media",
+        "chart": "numeric",
+        "label": "pieces produced lasy year",
+        "nbins": 20,
+    },
+    {
+        "section": "Media Reporting",
+        "code": "MSsoc2",
+        "title": "Please estimate: how many of these pieces focused on surveillance by intelligence agencies?",
+        "audience": "media",
+        "chart": "numeric",
+        "label": "pieces focused on surveillance by intelligence agencies",
+        "box_label": "pieces focused on<br>surveillance by intelligence agencies",
+        "nbins": 10,
+    },
+    {
+        "section": "Media Reporting",
+        "code": "MSsoc1_MSsoc2",
+        "title": None,
+        "chart": "custom",
+        "render": "compare_pieces",
+        "total": None,
+    },
+    {
+        "section": "Media Reporting",
+        "code": "MSsoc3",
+        "title": "How regularly do you report on surveillance by intelligence agencies?",
+        "audience": "media",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Media Reporting",
+        "code": "MSsoc4",
+        "title": "When covering surveillance by intelligence agencies, which topics usually prompt you to write an article?",
+        "audience": "media",
+        "chart": "choices",
+        "options": [
+            "follow_up_on_other_media",
+            "statements_government",
+            "oversight_reports",
+            "leaks",
+            "own_investigations",
+            "dont_know",
+            "prefer_not_to_say",
+            "other",
+        ],
+        "labels": [
+            "Follow-up on other media",
+            "Statements by Government",
+            "Oversight reports",
+            "Leaked material",
+            "Own investigations",
+            "I don't know",
+            "I prefer not to say",
+            "Other",
+        ],
+        "y_label": "people who answered 'Yes'",
+        "total": "respondents",
+    },
+    {
+        "section": "Media Reporting",
+        "code": "MSsoc5",
+        "title": "When covering surveillance by intelligence agencies, which of the following topics to you report on frequently?",
+        "audience": "media",
+        "chart": "choices",
+        "options": [
+            "national_security_risks",
+            "intelligence_success",
+            "intelligence_misconduct",
+            "oversight_interventions",
+            "oversight_failures",
+            "policy_debates_leg_reforms",
+            "other",
+        ],
+        "labels": [
+            "National security risks",
+            "Successful intelligence<br>operations",
+            "Misconduct by intelligence",
+            "Oversight interventions",
+            "Oversight failures",
+            "Policy debates and/or<br>legilsative reform",
+            "Other",
+        ],
+        "y_label": "people who answered 'Yes'",
+        "total": "respondents",
+    },
+    {
+        "section": "Media Reporting",
+        "topic": "Transnational Scope",
+        "code": "MStrans1",
+        "title": "How often does your work on surveillance by intelligence agencies cover a transnational angle?",
+        "audience": "media",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Media Reporting",
+        "code": "MStrans2",
+        "title": "How often do you collaborate with colleagues covering other countries when working on surveillance by intelligence agencies?",
+        "audience": "media",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Media Reporting",
+        "code": "MStrans3",
+        "title": "Have those collaborations included an investigative research project with colleagues from abroad?",
+        "audience": "media",
+        "chart": "pie",
+        "colors": YES_NO_COLORS,
+    },
+    {
+        "section": "Media Reporting",
+        "topic": "Perceived Impact",
+        "code": "MSimpact1",
+        "title": "When you think about public responses to your articles on intelligence agencies by readers and colleagues, did you receive any of the following forms of public feedback or engagement?",
+        "audience": "media",
+        "chart": "choices",
+        "options": [
+            "above_avg_comments",
+            "above_avg_shares",
+            "above_avg_readers",
+            "letters_to_the_editor",
+            "follow_up_by_other_media",
+            "other",
+            "none_of_the_above",
+            "dont_know",
+            "prefer_not_to_say",
+        ],
+        "labels": [
+            "An above average number of comments",
+            "An above average number of shares",
+            "An above average number of readers",
+            "Letters to the editor",
+            "Follow-up reporting by other media",
+            "Other",
+            "None of the above",
+            "I don't know",
+            "I prefer not to say",
+        ],
+        "y_label": "people who answered 'Yes'",
+        "total": "respondents",
+    },
+    {
+        "section": "Media Reporting",
+        "code": "MSimpact2",
+        "title": "When you think of responses to your articles on intelligence agencies by administrations or policy makers, did your reporting contribute to any of the following forms of political action?",
+        "audience": "media",
+        "chart": "choices",
+        "options": [
+            "diplomatic_pressure",
+            "civic_action",
+            "conversations_with_government",
+            "official_inquiries",
+            "government_statements",
+            "conversations_with_intelligence",
+            "dont_know",
+            "prefer_not_to_say",
+            "other",
+        ],
+        "labels": [
+            "My reporting led to<br>diplomatic pressure being exercised",
+            "My reporting spurred<br>civic action",
+            "My reporting led to<br>a conversation with policy makers",
+            "My reporting spurred<br>official inquiries",
+            "My reporting prompted<br>the government to issue a public statement",
+            "My reporting led to<br>a conversation with intelligence practitioners",
+            "I don't know",
+            "I prefer not to say",
+            "Other",
+        ],
+        "y_label": "people who answered 'Yes'",
+        "font_size": 11,
+        "total": "respondents",
+    },
+    # Public Campaigning
+    {
+        "section": "Public Campaigning",
+        "topic": "Activity",
+        "code": "CScampact2",
+        "title": "How important are the following campaigning tools for your work concerning intelligence-related issues?",
+        "audience": "cso",
+        "chart": "likert",
+        "options": [
+            "media_contributions",
+            "own_publications",
+            "petitions_open_letters",
+            "public_events",
+            "collaborations",
+            "demonstrations",
+            "social_media",
+            "advertising",
+            "volunteer_activities",
+            "providing_technical_tools",
+            "support_for_eu_campaigns",
+            "other",
+        ],
+        "labels": [
+            "Media contributions",
+            "Own publications",
+            "Petitions and open letters",
+            "Public events",
+            "Collaborations with celebrities and influencers",
+            "Demonstrations and rallies",
+            "Social media communications",
+            "Advertising",
+            "Volunteer activities",
+            "Providing technical tools",
+            "Support for campaign activities in other countries",
+            "Other",
+        ],
+        "bars": IMPORTANCE_BARS,
+        "total": "answered",
+    },
+    {
+        "section": "Public Campaigning",
+        "topic": "Transnational Scope",
+        "code": "CScamptrans1",
+        "title": "How frequently do your public campaigns address transnational issues of surveillance by intelligence agencies?",
+        "audience": "cso",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Public Campaigning",
+        "code": "CScamptrans2",
+        "title": "When conducting public campaigns on surveillance by intelligence agencies, how often do you collaborate with civil society actors in other countries?",
+        "audience": "cso",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Public Campaigning",
+        "topic": "Perceived Impact",
+        "code": "CScampimpact1",
+        "title": "How much do you agree with the following statements concerning the effectiveness of your campaigning activities regarding intelligence-related issues over the past 5 years?",
+        "audience": "cso",
+        "chart": "likert",
+        "options": [
+            "increased_awareness",
+            "policies_reflect_demands",
+            "created_media_attention",
+            "achieved_goals",
+        ],
+        "labels": [
+            "Helped increase public awareness",
+            "Our demands have been reflected in politics",
+            "Created media attention",
+            "Achieved defined goals",
+        ],
+        "bars": AGREEMENT_BARS,
+        "total": "answered",
+    },
+    # Policy Advocacy
+    {
+        "section": "Policy Advocacy",
+        "topic": "Activity",
+        "code": "CSadvocact2",
+        "title": "How important are the following policy advocacy tools for your work on intelligence-related issues?",
+        "audience": "cso",
+        "chart": "likert",
+        "options": [
+            "research",
+            "consultations",
+            "briefings",
+            "expert_events",
+            "participation_in_fora",
+            "legal_opinions",
+            "informal_encounters",
+            "other",
+        ],
+        "labels": [
+            "Research & analysis",
+            "Contributing to consultations",
+            "Briefing of policy makers",
+            "Expert events",
+            "Participation in fora or bodies",
+            "Legal opinions",
+            "Informal encounters",
+            "Other",
+        ],
+        "bars": IMPORTANCE_BARS,
+        "total": "answered",
+    },
+    {
+        "section": "Policy Advocacy",
+        "topic": "Transnational Scope",
+        "code": "CSadvoctrans1",
+        "title": "How frequently does your policy advocacy address transnational issues of surveillance by intelligence agencies?",
+        "audience": "cso",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Policy Advocacy",
+        "code": "CSadvoctrans2",
+        "title": "When performing policy advocacy concerning surveillance by intelligence agencies, how often do you collaborate with civil society actors in other countries?",
+        "audience": "cso",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Policy Advocacy",
+        "topic": "Perceived Impact",
+        "code": "CSadvocimpact1",
+        "title": "How much do you agree with the following statements concerning the effectiveness of your advocacy activities regarding intelligence-related issues over the past 5 years?",
+        "audience": "cso",
+        "chart": "likert",
+        "options": [
+            "increased_awareness",
+            "policies_reflect_recommendations",
+            "more_informed_debates",
+            "achieved_goals",
+        ],
+        "labels": [
+            "Helped increase public awareness",
+            "Our policy recommendations have been reflected in politics",
+            "Contributed to more informed debate",
+            "Achieved defined goals",
+        ],
+        "bars": AGREEMENT_BARS,
+        "total": None,
+    },
+    # Strategic Litigation
+    {
+        "section": "Strategic Litigation",
+        "topic": "Activity",
+        "code": "CSlitigateact2",
+        "title": "How important are the following policy litigateacy tools for your work on intelligence-related issues?",
+        "audience": "cso",
+        "chart": "likert",
+        "options": [
+            "initiating_lawsuit",
+            "initiating_complaint",
+            "supporting_existing_legislation",
+            "other",
+        ],
+        "labels": [
+            "Initiating and/or coordinating a lawsuit",
+            "Initiating a legal complaint",
+            "Supporting existing legislation",
+            "Other",
+        ],
+        "bars": IMPORTANCE_BARS,
+        "total": "answered",
+    },
+    {
+        "section": "Strategic Litigation",
+        "topic": "Costs",
+        "code": "CSlitigatecost1",
+        "title": "How frequently did the costs (e.g. court fees, loser pays principles, lawyers fees) prevent your organisation from starting a strategic litigation process?",
+        "audience": "cso",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Strategic Litigation",
+        "code": "CSlitigatecost2",
+        "title": "How frequently did your organisation benefit from pro bono support?",
+        "audience": "cso",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Strategic Litigation",
+        "code": "CSlitigatecost3",
+        "title": "Imagine your organisation lost a strategic litigation case concerning surveillance by intelligence agencies. How financially risky would it be for the organisation to be defeated in court?",
+        "audience": "cso",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Strategic Litigation",
+        "topic": "Transnational Scope",
+        "code": "CSlitigatetrans1",
+        "title": "How frequently do your strategic litigation cases address transnational issues of surveillance by intelligence agencies?",
+        "audience": "cso",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Strategic Litigation",
+        "code": "CSlitigatetrans2",
+        "title": "When performing strategic litigation concerning surveillance by intelligence agencies, how often do you collaborate with civil society actors in other countries?",
+        "audience": "cso",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Strategic Litigation",
+        "topic": "Perceived Impact",
+        "code": "CSlitigateimpact1",
+        "title": "How much do you agree with the following statements concerning the effectiveness of your strategic litigation activities regarding surveillance by intelligence agencies over the past 5 years?",
+        "audience": "cso",
+        "chart": "likert",
+        "options": [
+            "increased_awareness",
+            "changed_the_law",
+            "amendments_of_the_law",
+            "revealed_new_information",
+            "achieved_goals",
+        ],
+        "labels": [
+            "Helped increase public awareness",
+            "Changed the prevalent case law",
+            "Led to amendments in legislation",
+            "Revealed new information",
+            "Achieved defined goals",
+        ],
+        "bars": AGREEMENT_BARS,
+        "total": "answered",
+    },
+    # Protection
+    {
+        "section": "Protection",
+        "topic": "Operational Protection",
+        "code": "protectops1",
+        "title": "Have you taken any of the following measures to protect your datas from attacks and surveillance?",
+        "chart": "likert",
+        "options": ["sectraining", "e2e"],
+        "labels": [
+            "Participation in<br>digital security training",
+            "Use of E2E encrypted<br>communication channels",
+        ],
+        "bars": YES_NO_BARS,
+        "total": "max",
+    },
+    {
+        "section": "Protection",
+        "code": "protectops2",
+        "title": "Were any of these measures provided by your employer?",
+        "chart": "pie",
+        "colors": YES_NO_COLORS,
+        "legend_orientation": "v",
+    },
+    {
+        "section": "Protection",
+        "code": "protectops3",
+        "title": "How important is the use of the following technical tools for you to protect your communications, your online activities and the data you handle?",
+        "note": "† The option'Secure Drop' was only available to Journalists",
+        "chart": "likert",
+        "options": [
+            "encrypted_email",
+            "vpn",
+            "tor",
+            "e2e_chat",
+            "encrypted_hardware",
+            "2fa",
+            "secure_drop",
+            "other",
+        ],
+        "labels": [
+            "Encrypted Email",
+            "VPN",
+            "Tor",
+            "E2E Messengers",
+            "Encrpyted hardware",
+            "Two-Factor authentication",
+            "Secure Drop †",
+            "Other",
+        ],
+        "bars": IMPORTANCE_BARS,
+        "total": "max",
+    },
+    {
+        "section": "Protection",
+        "code": "protectops4",
+        "title": "Which of the following statements best describes your level of confidence in the protection offered by technological tools?",
+        "chart": "scale_pie",
+        "style": {
+            "height": 600,
+            "font_size": 13,
+            "legend_font_size": 11,
+            "legend_x": -1.0,
+            "legend_y": 2.0,
+        },
+    },
+    {
+        "section": "Protection",
+        "topic": "Legal Protection",
+        "code": "protectleg1",
+        "title": "When working on intelligence-related issues, do you feel you have reason to be concerned about...",
+        "details": "- surveillance of your activities (CSO professionals)\n- regarding the protection of your sources (Journalists)",
+        "chart": "scale_pie",
+    },
+    {
+        "section": "Protection",
+        "code": "protectleg2",
+        "title": "Do you regard the existing legal protections against surveillance of your activities in your country as a sufficient safeguard for your work on intelligence-related issues?",
+        "chart": "pie",
+        "colors": YES_NO_COLORS_ALT,
+    },
+    {
+        "section": "Protection",
+        "code": "protectleg3",
+        "title": "Are any of the following forms of institutional support readily available to you?",
+        "chart": "likert",
+        "options": ["free_counsel", "cost_insurance", "other"],
+        "labels": ["Free legal counsel", "Legal cost insurance", "Other"],
+        "bars": [
+            ("Yes", 2),
+            ("No", 0),
+            ("I don't know", 5, 0.8),
+            ("I prefer not to say", 4, 0.8),
+        ],
+        "total": "answered",
+    },
+    {
+        "section": "Protection",
+        "topic": "Rights to Access",
+        "code": "MSprotectrta1",
+        "title": "As a journalist in the country you primarily work in, do you have a special right to know if you have been subjected to surveillance in the past?",
+        "audience": "media",
+        "chart": "pie",
+        "colors": YES_NO_COLORS_ALT,
+    },
+    {
+        "section": "Protection",
+        "code": "MSprotectrta2",
+        "title": "Have you ever made use of this right?",
+        "audience": "media",
+        "chart": "pie",
+        "colors": YES_NO_COLORS_ALT,
+    },
+    {
+        "section": "Protection",
+        "code": "MSprotectrta3",
+        "title": "Is this right available to all journalists, even non-citizens?",
+        "audience": "media",
+        "chart": "pie",
+        "colors": YES_NO_COLORS_ALT,
+    },
+    {
+        "section": "Protection",
+        "code": "MSprotectrta4",
+        "title": "Have you ever submitted a data subject access request (based on your right to access as defined in the GDPR) related to surveillance by intelligence agencies?",
+        "audience": "media",
+        "chart": "pie",
+        "colors": YES_NO_COLORS_ALT,
+    },
+    {
+        "section": "Protection",
+        "code": "MSprotectrta5",
+        "title": "Over the past 5 years, have you received responses to your data subject access request(s) in a timely manner?",
+        "audience": "media",
+        "chart": "pie",
+        "colors": {
+            "Never": 0,
+            "No, usually longer than 30 days": 1,
+            "Yes, within 30 days": 2,
+            "I don't know": 5,
+            "I prefer not to say": 4,
+        },
+    },
+    {
+        "section": "Protection",
+        "code": "MSprotectrta6",
+        "title": "If you received a response to a data subject access request, was the information provided helpful?",
+        "audience": "media",
+        "chart": "pie",
+        "colors": {
+            "Yes, the information provided was helpful": 2,
+            "Partly, the information provided was somewhat <br>helpful but contained omissions": 1,
+            "No, the information provided was not at all helpful": 0,
+            "I don't know": 5,
+            "I prefer not to say": 4,
+        },
+    },
+    # Constraints
+    {
+        "section": "Constraints",
+        "topic": "Censorship",
+        "code": "MSconstraintcen1",
+        "title": "When covering intelligence related issues, have you consulted state bodies or officials prior to the publication of the story due to the sensitivity of information?",
+        "audience": "media",
+        "chart": "pie",
+        "colors": YES_NO_COLORS_ALT,
+    },
+    {
+        "section": "Constraints",
+        "code": "MSconstraintcen2",
+        "title": "Is there an institutional setting that advises journalists to engage in a consultation process prior to the publication of sensitive information (i.e. a code of conduct or a committee)?",
+        "audience": "media",
+        "chart": "pie",
+        "colors": YES_NO_COLORS_ALT,
+    },
+    {
+        "section": "Constraints",
+        "code": "MSconstraintcen3",
+        "title": "Please estimate: How often have you consulted state bodies or officials prior to publishing  intelligence-related stories in the past 5 years?",
+        "audience": "media",
+        "chart": "numeric",
+        "label": "times",
+        "nbins": 10,
+        "box": False,
+    },
+    {
+        "section": "Constraints",
+        "code": "MSconstraintcen4",
+        "title": "Has this consultation process prevented a publication of yours from appearing?",
+        "audience": "media",
+        "chart": "pie",
+        "colors": YES_NO_COLORS_ALT,
+    },
+    {
+        "section": "Constraints",
+        "code": "MSconstraintcen5",
+        "title": "Have you been required to make edits as part of this consultation process?",
+        "audience": "media",
+        "chart": "pie",
+        "colors": YES_NO_COLORS_ALT,
+    },
+    {
+        "section": "Constraints",
+        "topic": "Interference",
+        "code": "constraintinter1",
+        "title": "Has your institution or have you yourself been subjected to surveillance by intelligence agencies in the past five years?",
+        "chart": "pie",
+        "colors": {
+            "No": 0,
+            "Yes, I have evidence": 2,
+            "Yes, I suspect": 3,
+            "I don't know": 4,
+            "I prefer not to say": 5,
+        },
+        "legend_orientation": "v",
+    },
+    {
+        "section": "Constraints",
+        "code": "constraintinter2",
+        "title": "In the past 5 years, have you been threatened with prosecution or have you actually been prosecuted for your work on intelligence-related issues?",
+        "chart": "pie",
+        "colors": {"No": 0, "Yes": 2},
+    },
+    {
+        "section": "Constraints",
+        "code": "constraintinter3",
+        "title": "What was the outcome?",
+        "chart": "pie",
+    },
+    {
+        "section": "Constraints",
+        "code": "constraintinter4",
+        "title": "In the past 5 years, have you experienced any of the following interferences by public authorities in relation to your work on intelligence related topics?",
+        "chart": "likert",
+        "options": [
+            "police_search",
+            "seizure",
+            "extortion",
+            "violent_threat",
+            "inspection_during_travel",
+            "detention",
+            "surveillance_signalling",
+            "online_harassment",
+            "entry_on_deny_lists",
+            "exclusion_from_events",
+            "public_defamation",
+        ],
+        "labels": [
+            "Police searches",
+            "Seizure of material",
+            "Extortion",
+            "Violent threats",
+            "Special inspections during travels",
+            "Detention",
+            "Surveillance signalling",
+            "Online harassment",
+            "Entry on deny lists",
+            "Exclusion from events",
+            "Public defamation",
+        ],
+        "bars": YES_NO_BARS_FADED,
+        "total": "max",
+    },
+    {
+        "section": "Constraints",
+        "code": "constraintinter5",
+        "title": "In the past 5 years, have you been approached by intelligence officials and received...",
+        "chart": "likert",
+        "options": ["unsolicited_information", "invitations", "other"],
+        "labels": [
+            "Unsolicited information",
+            "Invitations to off-the-record<br>events or meetings",
+            "Other",
+        ],
+        "bars": YES_NO_BARS_FADED,
+        "total": "max",
+    },
+    {
+        "section": "Constraints",
+        "code": "constraintinter6",
+        "title": "When working on intelligence-related issues have you ever experienced harassment by security agencies or politicians due to your...",
+        "chart": "likert",
+        "options": [
+            "gender",
+            "ethnicity",
+            "political",
+            "sexual",
+            "religious",
+            "other",
+        ],
+        "labels": [
+            "Gender",
+            "Ethnicity",
+            "Political orientation",
+            "Sexual orientation",
+            "Religious affiliation",
+            "Other",
+        ],
+        "bars": YES_NO_BARS_FADED,
+        "total": "max",
+    },
+    {
+        "section": "Constraints",
+        "topic": "Self Censorship",
+        "code": "MSconstraintself1",
+        "title": "Which of the following behaviours have you experienced or observed in your professional environment related to covering intelligence-related topics?",
+        "audience": "media",
+        "chart": "likert",
+        "options": [
+            "avoid",
+            "change_focus",
+            "change_timeline",
+            "abandon",
+            "leave_profession",
+            "other",
+        ],
+        "labels": [
+            "Avoided sensitive issues in<br>a story related to intelligence",
+            "Changed the focus of a story<br>related to intelligence",
+            "Changed the timeline for publication",
+            "Abandoned a story related to<br>intelligence",
+            "Considered leaving the profession<br>altogether",
+            "Other",
+        ],
+        "bars": YES_NO_BARS_ALT,
+        "total": "answered",
+    },
+    {
+        "section": "Constraints",
+        "code": "CSconstraintself1",
+        "title": "Which of the following behaviours have you experienced or observed in your professional environment related to your work on intelligence-related topics?",
+        "audience": "cso",
+        "chart": "likert",
+        "options": [
+            "avoid",
+            "cancelled_campaign",
+            "withdrew_litigation",
+            "leave_profession",
+            "other",
+        ],
+        "labels": [
+            "Avoided advocating for<br>contentious policy changes",
+            "Canceled a public campaign",
+            "Withdrew litigation case",
+            "Quit working on<br>intelligence-related issues",
+            "Other",
+        ],
+        "bars": YES_NO_BARS_ALT,
+        "total": None,
+    },
+    # Attitudes
+    {
+        "section": "Attitudes",
+        "topic": "Attitudes",
+        "code": "attitude1",
+        "title": "The following four statements are about **intelligence agencies**. Please select the statement you most agree with, based on your national context.",
+        "chart": "scale_pie",
+        "style": ATTITUDE_STYLE,
+    },
+    {
+        "section": "Attitudes",
+        "code": "attitude2",
+        "title": "The following four statements are about **intelligence oversight**. Please select the statement you most agree with, based on your national context.",
+        "chart": "scale_pie",
+        "missing": [
+            "A1: Intelligence oversight generally succeeds<br>in uncovering past misconduct and preventing<br>future misconduct"
+        ],
+        "style": ATTITUDE_STYLE,
+        "total": None,
+    },
+    {
+        "section": "Attitudes",
+        "code": "attitude3",
+        "title": "In your personal view, what are the goals of intelligence oversight? Please select the three goals of oversight you subscribe to the most.",
+        "chart": "choices",
+        "options": [
+            "rule_of_law",
+            "civil_liberties",
+            "effectiveness_of_intel",
+            "legitimacy_of_intel",
+            "trust_in_intel",
+            "critique_of_intel",
+            "prefer_not_to_say",
+        ],
+        "labels": [
+            "Rule of law",
+            "Civil liberties",
+            "Effectiveness of intelligence agencies",
+            "Legitimacy of intelligence agencies",
+            "Trust in intelligence agencies",
+            "Critique of intelligence agencies",
+            "I prefer not to say",
+        ],
+        "y_label": "people who answered 'Yes'",
+        "country_colors": COUNTRY_COLORS_ALT,
+        "marginal": "rug",
+        "total": None,
+    },
+    {
+        "section": "Attitudes",
+        "code": "attitude4",
+        "title": "Which of the following actors do you trust the most to **enable public debate** on surveillance by intelligence agencies?",
+        "chart": "ranking",
+        "options": OVERSIGHT_BODIES,
+        "total": None,
+    },
+    {
+        "section": "Attitudes",
+        "code": "attitude5",
+        "title": "Which of the following actors do you trust the most to **contest surveillance** by intelligence agencies?",
+        "chart": "ranking",
+        "options": OVERSIGHT_BODIES,
+        "total": None,
+    },
+    {
+        "section": "Attitudes",
+        "code": "attitude6",
+        "title": "Which of the following actors do you trust the most to **enforce compliance** regarding surveillance by intelligence agencies?",
+        "chart": "ranking",
+        "options": OVERSIGHT_BODIES,
+        "total": None,
+    },
+]
+
+
+def section_questions(section):
+    """Return the entries of QUESTIONS shown in `section`, in order"""
+    return [question for question in QUESTIONS if question["section"] == section]
@@ -0,0 +1,661 @@
+"""Recoding of the LimeSurvey answer codes into answer labels.
+
+LimeSurvey exports answers as codes ("AO01", "AO02", ...), and the same code
+does not always stand for the same answer: some questions were coded
+differently in one survey type or country. The mappings are kept as data in
+RECODES, one entry per group of columns:
+
+columns   -- the columns the entry applies to
+codes     -- mapping of answer codes to labels for all rows (optional)
+overrides -- mappings applied on top of `codes` to the rows of one `field`
+             (survey type) and/or `country` (optional)
+
+`recode` maps every column once. The distinct values of a column are looked
+up in the mappings and the rows take their label by the position of their
+value, so the cost no longer grows with the number of mappings per column.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _columns(stem, options):
+    return [f"{stem}[{option}]" for option in options]
+
+
+# ===========================================================================
+# Answer scales
+# ===========================================================================
+
+YES_NO = {
+    "AO01": "Yes",
+    "AO02": "No",
+    "AO03": "I don't know",
+    "AO04": "I prefer not to say",
+}
+KNOWLEDGE = {
+    "AO01": "A1: Expert knowledge",
+    "AO02": "A2: Advanced knowledge",
+    "AO03": "A3: Some knowledge",
+    "AO04": "A4: Basic knowledge",
+    "AO05": "A5: No knowledge",
+    "AO06": "A6: I don't know",
+    "AO07": "A7: I prefer not to say",
+}
+FREQUENCY = {
+    "AO01": "A1: Always",
+    "AO02": "A2: Often (75% of the time)",
+    "AO03": "A3: Sometimes (50% of the time)",
+    "AO04": "A4: Rarely (25% of the time)",
+    "AO05": "A5: Never",
+    "AO06": "A6: I don't know",
+    "AO07": "A7: I prefer not to say",
+}
+IMPORTANCE = {
+    "AO01": "Very important",
+    "AO02": "Important",
+    "AO03": "Somewhat important",
+    "AO04": "Slightly important",
+    "AO05": "Not important at all",
+    "AO06": "I don't know",
+    "AO07": "I prefer not to say",
+}
+# Some importance scales skip codes in LimeSurvey
+IMPORTANCE_SPARSE = {
+    "AO01": "Very important",
+    "AO02": "Important",
+    "AO03": "Somewhat important",
+    "AO04": "Slightly important",
+    "AO07": "Not important at all",
+    "AO09": "I don't know",
+    "AO11": "I prefer not to say",
+}
+AGREEMENT = {
+    "AO01": "Agree completely",
+    "AO02": "Agree to a great extent",
+    "AO03": "Agree somewhat",
+    "AO04": "Agree sligthly",
+    "AO05": "Not agree at all",
+    "AO06": "I don't know",
+    "AO07": "I prefer not to say",
+}
+# ... or continue the codes of a previous question
+AGREEMENT_CONTINUED = {
+    "AO01": "Agree completely",
+    "AO42": "Agree to a great extent",
+    "AO43": "Agree somewhat",
+    "AO44": "Agree sligthly",
+    "AO45": "Not agree at all",
+    "AO46": "I don't know",
+    "AO47": "I prefer not to say",
+}
+BODIES = {
+    "AO01": "Parliamentary oversight bodies",
+    "AO02": "Judicial oversight bodies",
+    "AO03": "Independent expert bodies",
+    "AO04": "Data protection authorities",
+    "AO05": "Audit courts",
+    "AO06": "CSOs | The media",
+}
+
+# ===========================================================================
+# Recode tables
+# ===========================================================================
+
+RECODES = [
+    {
+        "columns": ["hr1"],
+        "overrides": [
+            {
+                "field": "CSO Professionals",
+                "codes": {
+                    "AO01": "Full-time",
+                    "AO02": "Part-time (>50%)",
+                    "AO03": "Part-time (<50%)",
+                    "AO04": "Freelance",
+                    "AO05": "Unpaid",
+                    "AO06": "Other",
+                    "AO07": "I don't know",
+                    "AO08": "I prefer not to say",
+                },
+            },
+            {
+                "field": "Journalists",
+                "codes": {
+                    "AO01": "Full-time",
+                    "AO02": "Part-time (>50%)",
+                    "AO03": "Part-time (<50%)",
+                    "AO04": "Freelance",
+                    "AO05": "Unpaid",
+                    "AO08": "Other",
+                    "AO06": "I don't know",
+                    "AO07": "I prefer not to say",
+                },
+            },
+        ],
+    },
+    {
+        "columns": ["MShr4"],
+        "codes": {
+            "AO01": "A1: I had enough time",
+            "AO02": "A2: I had some time",
+            "AO03": "A3: I had very little time",
+            "AO04": "A4: I had no time",
+            "AO05": "A5: I don't know",
+            "AO06": "A6: I prefer not to say",
+        },
+    },
+    {
+        "columns": ["gender"],
+        "codes": {
+            "AO01": "Female",
+            "AO02": "Non-binary",
+            "AO03": "Male",
+            "AO04": "I prefer not to say",
+            "AO05": "Other",
+        },
+    },
+    {
+        "columns": ["expertise2", "expertise3", "expertise4"],
+        "codes": KNOWLEDGE,
+    },
+    {
+        "columns": ["finance1"],
+        "codes": {
+            "AO01": "A1: A great deal of funding",
+            "AO02": "A2: Sufficient funding",
+            "AO03": "A3: Some funding",
+            "AO04": "A4: Little funding",
+            "AO05": "A5: No funding",
+            "AO06": "A6: I don't know",
+            "AO07": "A7: I prefer not to say",
+        },
+    },
+    {
+        "columns": ["MSfinance2"],
+        "codes": YES_NO,
+    },
+    {
+        "columns": _columns(
+            "CSfinance2",
+            [
+                "private_foundations",
+                "donations",
+                "national_public_funds",
+                "corporate_sponsorship",
+                "international_public_funds",
+                "other",
+            ],
+        ),
+        "codes": IMPORTANCE_SPARSE,
+    },
+    {
+        "columns": ["finance4"],
+        "codes": {
+            "AO01": "Clearly beneficial for fundraising",
+            "AO02": "Rather beneficial for fundraising",
+            "AO03": "No effect on fundraising",
+            "AO04": "Rather constraining for fundraising",
+            "AO05": "Clearly constraining for fundraising",
+            "AO06": "I don't know",
+            "AO07": "I prefer not to say",
+        },
+    },
+    {
+        "columns": ["foi1"],
+        "codes": YES_NO,
+    },
+    {
+        "columns": ["foi3"],
+        "codes": {
+            "AO01": "A1: Yes, within 30 days",
+            "AO02": "A2: No, usually longer than 30 days",
+            "AO03": "A3: Never",
+            "AO04": "A4: I don't know",
+            "AO05": "A5: I prefere not to say",
+        },
+    },
+    {
+        "columns": ["foi4"],
+        "overrides": [
+            {
+                "field": "CSO Professionals",
+                "codes": {
+                    "AO01": "A1: Very helpful",
+                    "AO03": "A2: Helpful in parts",
+                    "AO05": "A3: Not helpful at all",
+                    "AO06": "A4: I don't know",
+                    "AO07": "A5: I prefer not to say",
+                },
+            },
+            {
+                "field": "Journalists",
+                "codes": {
+                    "AO01": "A1: Very helpful",
+                    "AO02": "A2: Helpful in parts",
+                    "AO03": "A3: Not helpful at all",
+                    "AO06": "A4: I don't know",
+                    "AO07": "A5: I prefer not to say",
+                },
+            },
+        ],
+    },
+    {
+        "columns": ["MSapp1", "MSapp2"],
+        "codes": {"AO01": "Yes", "AO02": "No", "AO03": "I don't know"},
+    },
+    {
+        "columns": ["MStrans1"],
+        "codes": {
+            "AO001": "A1: Always",
+            "AO002": "A2: Often (75% of the time)",
+            "AO003": "A3: Sometimes (50% of the time)",
+            "AO004": "A4: Rarely (25% of the time)",
+            "AO005": "A5: Never",
+            "AO006": "A6: I don't know",
+            "AO007": "A7: I prefer not to say",
+        },
+    },
+    {
+        "columns": ["MStrans2"],
+        "codes": FREQUENCY,
+    },
+    {
+        "columns": ["MStrans3"],
+        "codes": YES_NO,
+    },
+    {
+        "columns": ["CSpreselection"],
+        "codes": {
+            "AO01": "Public Campaigning",
+            "AO02": "Policy Advocacy",
+            "AO03": "Strategic Litigation",
+        },
+    },
+    {
+        "columns": _columns(
+            "CScampact2",
+            [
+                "media_contributions",
+                "own_publications",
+                "petitions_open_letters",
+                "public_events",
+                "collaborations",
+                "demonstrations",
+                "social_media",
+                "advertising",
+                "volunteer_activities",
+                "providing_technical_tools",
+                "support_for_eu_campaigns",
+                "other",
+            ],
+        ),
+        "codes": IMPORTANCE,
+    },
+    {
+        "columns": ["CScamptrans1", "CScamptrans2"],
+        "codes": FREQUENCY,
+    },
+    {
+        "columns": _columns(
+            "CScampimpact1",
+            [
+                "increased_awareness",
+                "policies_reflect_demands",
+                "created_media_attention",
+                "achieved_goals",
+            ],
+        ),
+        "codes": AGREEMENT,
+    },
+    {
+        "columns": _columns(
+            "CSadvocact2",
+            [
+                "research",
+                "consultations",
+                "briefings",
+                "expert_events",
+                "participation_in_fora",
+                "legal_opinions",
+                "informal_encounters",
+                "other",
+            ],
+        ),
+        "codes": IMPORTANCE_SPARSE,
+        # Coding in LimeSurvey differs for UK
+        "overrides": [{"country": "United Kingdom", "codes": IMPORTANCE}],
+    },
+    {
+        "columns": ["CSadvoctrans1", "CSadvoctrans2"],
+        "codes": FREQUENCY,
+    },
+    {
+        "columns": _columns(
+            "CSadvocimpact1",
+            [
+                "increased_awareness",
+                "policies_reflect_recommendations",
+                "more_informed_debates",
+                "achieved_goals",
+            ],
+        ),
+        "codes": AGREEMENT_CONTINUED,
+        # Here only DE survey is differenlty coded
+        "overrides": [{"country": "Germany", "codes": AGREEMENT}],
+    },
+    {
+        "columns": _columns(
+            "CSlitigateact2",
+            [
+                "initiating_lawsuit",
+                "initiating_complaint",
+                "supporting_existing_legislation",
+                "other",
+            ],
+        ),
+        "codes": IMPORTANCE,
+    },
+    {
+        "columns": ["CSlitigatetrans1", "CSlitigatetrans2"],
+        "codes": FREQUENCY,
+    },
+    {
+        "columns": _columns(
+            "CSlitigateimpact1",
+            [
+                "increased_awareness",
+                "changed_the_law",
+                "amendments_of_the_law",
+                "revealed_new_information",
+                "achieved_goals",
+            ],
+        ),
+        "codes": AGREEMENT_CONTINUED,
+        "overrides": [{"country": "Germany", "codes": AGREEMENT}],
+    },
+    {
+        "columns": ["CSlitigatecost1", "CSlitigatecost2"],
+        "codes": {
+            "AO01": "A1: Always or very often",
+            "AO02": "A2: Often (75% of the time)",
+            "AO03": "A3: Sometimes (50% of the time)",
+            "AO04": "A4: Rarely (25% of the time)",
+            "AO05": "A5: Never or rarely",
+            "AO06": "A6: I don't know",
+            "AO07": "A7: I prefer not to say",
+        },
+    },
+    {
+        "columns": ["CSlitigatecost3"],
+        "codes": {
+            "AO01": "A1: Not risky at all",
+            "AO02": "A2: Somewaht risky",
+            "AO03": "A3: Very risky",
+            "AO04": "A4: I don't know",
+            "AO05": "A5: I prefer not to say",
+        },
+    },
+    {
+        "columns": ["protectops1[sectraining]", "protectops1[e2e]", "protectops2"],
+        "codes": YES_NO,
+    },
+    {
+        "columns": _columns(
+            "protectops3",
+            [
+                "encrypted_email",
+                "vpn",
+                "tor",
+                "e2e_chat",
+                "encrypted_hardware",
+                "2fa",
+                "secure_drop",
+                "other",
+            ],
+        ),
+        "codes": IMPORTANCE,
+        # this was hard to spot. Only the CS survey for DE was coded as below
+        "overrides": [
+            {
+                "field": "CSO Professionals",
+                "country": "Germany",
+                "codes": {
+                    "AO01": "A1: Very important",
+                    "AO02": "A2: Important",
+                    "AO03": "A3: Somewhat important",
+                    "AO04": "A4: Slightly important",
+                    "AO05": "A5: Not important at all",
+                    # notice the AO09 instead of AO06 as above
+                    "AO09": "A6: I don't know",
+                    "AO11": "A7: I prefer not to say",
+                },
+            }
+        ],
+    },
+    {
+        "columns": ["protectops4"],
+        "codes": {
+            "AO01": "A1: I have full confidence that the right tools <br>will protect my communication from surveillance",
+            "AO02": "A2: Technological tools help to protect my identity <br>to some extent, but an attacker with sufficient power <br>may eventually be able to bypass my technological <br>safeguards",
+            "AO03": "A3: Under the current conditions of communications <br>surveillance, technological solutions cannot offer <br>sufficient protection for the data I handle",
+            "AO04": "A4: I have no confidence in the protection offered by <br>technological tools",
+            "AO05": "A5: I try to avoid technology-based communication whenever <br>possible when I work on intelligence-related issues",
+            "AO06": "A6: I don't know",
+            "AO07": "A7: I prefer not to say",
+        },
+    },
+    {
+        "columns": ["protectleg1"],
+        "codes": {
+            "AO01": "A1: Always",
+            "AO02": "A2: Often",
+            "AO03": "A3: Sometimes",
+            "AO04": "A4: Rarely",
+            "AO05": "A5: Never",
+            "AO06": "A6: I don't know",
+            "AO07": "A7: I prefer not to say",
+        },
+    },
+    {
+        "columns": ["protectleg2"]
+        + _columns("protectleg3", ["free_counsel", "cost_insurance", "other"])
+        + [f"MSprotectrta{i}" for i in range(1, 5)],
+        "codes": YES_NO,
+    },
+    {
+        "columns": ["MSprotectrta5"],
+        "codes": {
+            "AO01": "Yes, within 30 days",
+            "AO02": "No, usually longer than 30 days",
+            "AO03": "Never",
+            "AO04": "I don't know",
+            "AO05": "I prefer not to say",
+        },
+    },
+    {
+        "columns": ["MSprotectrta6"],
+        "codes": {
+            "AO01": "Yes, the information provided was helpful",
+            "AO02": "Partly, the information provided was somewhat <br>helpful but contained omissions",
+            "AO03": "No, the information provided was not at all helpful",
+            "AO04": "I don't know",
+            "AO05": "I prefer not to say",
+        },
+    },
+    {
+        "columns": [f"MSconstraintcen{i}" for i in [1, 2, 4, 5]],
+        "codes": YES_NO,
+    },
+    {
+        "columns": ["constraintinter1"],
+        "codes": {
+            "AO01": "Yes, I have evidence",
+            "AO02": "Yes, I suspect",
+            "AO03": "No",
+            "AO04": "I don't know",
+            "AO05": "I prefer not to say",
+        },
+    },
+    {
+        "columns": ["constraintinter2"],
+        "codes": YES_NO,
+    },
+    {
+        "columns": ["constraintinter3"],
+        "codes": {
+            "AO01": "I was threatened with prosecution",
+            "AO02": "I was prosecuted but acquitted",
+            "AO03": "I was prosecuted and convicted",
+            "AO04": "I don't know",
+            "AO05": "I prefer not to say",
+        },
+    },
+    {
+        "columns": _columns(
+            "constraintinter4",
+            [
+                "police_search",
+                "seizure",
+                "extortion",
+                "violent_threat",
+                "inspection_during_travel",
+                "detention",
+                "surveillance_signalling",
+                "online_harassment",
+                "entry_on_deny_lists",
+                "exclusion_from_events",
+                "public_defamation",
+            ],
+        )
+        + _columns(
+            "constraintinter5", ["unsolicited_information", "invitations", "other"]
+        )
+        + _columns(
+            "constraintinter6",
+            ["gender", "ethnicity", "political", "sexual", "religious", "other"],
+        )
+        + _columns(
+            "MSconstraintself1",
+            [
+                "avoid",
+                "change_focus",
+                "change_timeline",
+                "abandon",
+                "leave_profession",
+                "other",
+            ],
+        )
+        + _columns(
+            "CSconstraintself1",
+            [
+                "avoid",
+                "cancelled_campaign",
+                "withdrew_litigation",
+                "leave_profession",
+                "other",
+            ],
+        ),
+        "codes": YES_NO,
+    },
+    {
+        "columns": ["attitude1"],
+        "codes": {
+            "AO01": "A1: Intelligence agencies are incompatible with<br>democratic values and should be abolished",
+            "AO02": "A2: Intelligence agencies contradict democratic<br>principles, and their powers should be kept at a<br>bare minimum",
+            "AO03": "A3: Intelligence agencies are necessary and<br>legitimate institutions of democratic states,<br>even though they may sometimes overstep their<br>legal mandates",
+            "AO04": "A4: Intelligence agencies are a vital component<br>of national security and should be shielded from<br>excessive bureaucratic restrictions",
+            "AO05": "A5: I prefer not to say",
+        },
+    },
+    {
+        "columns": ["attitude2"],
+        "codes": {
+            "AO01": "A1: Intelligence oversight generally succeeds<br>in uncovering past misconduct and preventing<br>future misconduct",
+            "AO02": "A2: Intelligence oversight is mostly effective,<br>however its institutional design needs reform<br>for oversight practitioners to reliably uncover<br>past misconduct and prevent future misconduct",
+            "AO03": "A3: Intelligence oversight lacks efficacy,<br>hence a fundamental reorganization of oversight<br>capacity is needed for oversight practitioners<br>to reliably uncover past misconduct and prevent<br>future misconduct",
+            "AO04": "A4: Effective intelligence oversight is a<br>hopeless endeavour and even a systematic<br>reorganization is unlikely to ensure misconduct<br>is uncovered and prevented.",
+            "AO05": "A5: I prefer not to say",
+        },
+    },
+    {
+        "columns": [f"attitude{i}[{j}]" for i in range(4, 7) for j in range(1, 7)],
+        "codes": BODIES,
+        # Here, CS FR is coded differently
+        "overrides": [
+            {
+                "field": "CSO Professionals",
+                "country": "France",
+                "codes": {**BODIES, "AO07": "Audit courts"},
+            }
+        ],
+    },
+]
+
+# ===========================================================================
+# Recode engine
+# ===========================================================================
+
+
+def recode_column(col, codes, overrides=()):
+    """Return `col` with its answer codes replaced by labels.
+
+    The labels of `overrides` replace the labels of `codes`, or the codes
+    `codes` leaves alone, in the rows they select.
+
+    Keyword arguments:
+    col       -- the column (Series) to recode
+    codes     -- mapping of codes to labels for all rows
+    overrides -- (row mask, mapping) pairs (Default value = ())
+    """
+    positions, values = pd.factorize(col)
+    if len(values) == 0:
+        return col
+    values = list(values)
+    labels = [codes.get(value, value) for value in values]
+    # Missing values have the position -1, the last entry of every lookup
+    lookup = np.array(labels + [np.nan], dtype=object)
+    result = lookup[positions]
+    changed = labels != values
+    for mask, mapping in overrides:
+        overridden = [mapping.get(label, label) for label in labels]
+        if overridden == labels:
+            continue
+        changed = True
+        lookup = np.array(overridden + [np.nan], dtype=object)
+        result[mask] = lookup[positions[mask]]
+    if not changed:
+        return col
+    return pd.Series(result, index=col.index, name=col.name)
+
+
+def recode(df, recodes=RECODES):
+    """Replace the answer codes in `df` by labels, as given by `recodes`.
+
+    The columns "field" and "country" must already hold their labels.
+    Columns `df` does not have, such as those of the other survey type, are
+    skipped.
+    """
+    masks = {}
+
+    def rows(override):
+        key = (override.get("field"), override.get("country"))
+        if key not in masks:
+            mask = np.full(len(df.index), True)
+            if key[0] is not None:
+                mask &= (df["field"] == key[0]).to_numpy()
+            if key[1] is not None:
+                mask &= (df["country"] == key[1]).to_numpy()
+            masks[key] = mask
+        return masks[key]
+
+    for entry in recodes:
+        overrides = [
+            (rows(override), override["codes"])
+            for override in entry.get("overrides", [])
+        ]
+        for column in entry["columns"]:
+            if column not in df:
+                continue
+            df[column] = recode_column(df[column], entry.get("codes", {}), overrides)
+    return df
@@ -0,0 +1,56 @@
+"""Versioned, compressed snapshots of the LimeSurvey exports.
+
+Every fetch that brings new responses adds a snapshot of an export to the
+directory of the export, named after its version, the UTC time of the
+fetch: e.g. data/limesurvey/cs_uk_short/20211014T120000Z.csv.gz. Snapshots
+are gzip compressed and read through streaming decompression, so that the
+plain CSV is never written to disk.
+
+A snapshot updated with the new responses of a delta fetch is the previous
+snapshot with another gzip member appended. The previous snapshot is thus
+a prefix of the new one, which lets clean read only the new responses.
+"""
+
+import gzip
+import time
+from pathlib import Path
+
+SUFFIX = ".csv.gz"
+VERSION_FORMAT = "%Y%m%dT%H%M%SZ"
+# zlib's default, far faster than gzip's 9 for about the same size
+GZIP_LEVEL = 6
+
+
+def open_export(path, mode="rb"):
+    """Open the export at `path`, which is gzip compressed if it ends in .gz"""
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode, compresslevel=GZIP_LEVEL)
+    return open(path, mode)
+
+
+def new_version():
+    """Return the version of a snapshot taken now"""
+    return time.strftime(VERSION_FORMAT, time.gmtime())
+
+
+def snapshot_path(directory, version):
+    """Return the path of the snapshot `version` in `directory`"""
+    return str(Path(directory, f"{version}{SUFFIX}"))
+
+
+def versions(directory):
+    """Return the versions of the snapshots in `directory`, oldest first"""
+    paths = Path(directory).glob(f"*{SUFFIX}")
+    return sorted(path.name[: -len(SUFFIX)] for path in paths)
+
+
+def latest_snapshot(directory, version=None):
+    """Return the path of the latest snapshot in `directory`, or None.
+
+    Keyword arguments:
+    directory -- the directory of the snapshots of an export
+    version   -- the latest version to consider, e.g. to reprocess an old
+                 snapshot; all if None (Default value = None)
+    """
+    found = [v for v in versions(directory) if version is None or v <= version]
+    return snapshot_path(directory, found[-1]) if found else None
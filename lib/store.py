@@ -0,0 +1,58 @@
+"""Prebuilt figures of the explorer stored as Plotly JSON.
+
+There are only 13 sections and 12 filter combinations, so every figure the
+explorer can show is rendered ahead of time by scripts/prebuild_figures.py.
+Each figure is kept in its own file, in the JSON that Streamlit would send to
+the browser, so that serving it does not require building it.
+"""
+
+import json
+import re
+from pathlib import Path
+
+import plotly.utils
+
+
+def _slug(text):
+    return re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_")
+
+
+def figure_path(root, section, country, field, name):
+    """Return the path of the figure `name` shown in `section` for a filter"""
+    return Path(root, _slug(section), _slug(country), _slug(field), f"{name}.json")
+
+
+def write_figure(root, section, country, field, name, figure):
+    path = figure_path(root, section, country, field, name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    spec = json.dumps(figure.to_dict(), cls=plotly.utils.PlotlyJSONEncoder)
+    path.write_text(spec, encoding="utf-8")
+
+
+def read_figure(root, section, country, field, name):
+    """Return the JSON of a prebuilt figure, or None if it was not built"""
+    path = figure_path(root, section, country, field, name)
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def write_manifest(root, **digests):
+    """Record the digests of the inputs the figures at `root` were built from"""
+    Path(root, "manifest.json").write_text(json.dumps(digests, sort_keys=True))
+
+
+def read_manifest(root):
+    try:
+        return json.loads(Path(root, "manifest.json").read_text())
+    except FileNotFoundError:
+        return None
+
+
+def manifest_time(root):
+    """Return the modification time of the manifest at `root`, or None"""
+    try:
+        return Path(root, "manifest.json").stat().st_mtime
+    except FileNotFoundError:
+        return None
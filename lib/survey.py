@@ -0,0 +1,82 @@
+"""Columnar storage of the cleaned survey data.
+
+The cleaned data is mostly made up of long answer labels. Stored as object
+columns every row carries its own copy of the label, so `scripts/clean.py`
+also writes a Parquet file in which every choice column is a categorical,
+multiple choice columns are booleans and numeric columns are float32.
+"""
+
+import numpy as np
+import pandas as pd
+
+# ===========================================================================
+# Answer scales
+# ===========================================================================
+
+# Scales whose labels do not carry an "A1: " style prefix to order them by
+IMPORTANCE = [
+    "Very important",
+    "Important",
+    "Somewhat important",
+    "Slightly important",
+    "Not important at all",
+    "I don't know",
+    "I prefer not to say",
+]
+AGREEMENT = [
+    "Agree completely",
+    "Agree to a great extent",
+    "Agree somewhat",
+    "Agree sligthly",
+    "Not agree at all",
+    "I don't know",
+    "I prefer not to say",
+]
+YES_NO = ["Yes", "No", "I don't know", "I prefer not to say"]
+SCALES = [IMPORTANCE, AGREEMENT, YES_NO]
+
+# Open answers are kept as plain strings
+FREE_TEXT = ["CSlitigateimpact2"]
+
+
+def _categorical(col):
+    """Turn the object column `col` into a categorical.
+
+    Columns answered on one of the known scales, or with labels prefixed by
+    their position on the scale ("A1: ", "A2: ", ...), become ordered.
+    """
+    values = col.dropna().unique().tolist()
+    for scale in SCALES:
+        if set(values) <= set(scale):
+            return pd.Categorical(col, categories=scale, ordered=True)
+    if values and all(value[:1] == "A" and value[1:2].isdigit() for value in values):
+        return pd.Categorical(col, categories=sorted(values), ordered=True)
+    return pd.Categorical(col, categories=sorted(values))
+
+
+def to_columnar(df):
+    """Return a copy of the cleaned survey data with compact dtypes"""
+    columns = {}
+    for col in df.columns:
+        if df[col].dtype == bool or col in FREE_TEXT:
+            columns[col] = df[col]
+        elif pd.api.types.is_numeric_dtype(df[col]):
+            columns[col] = df[col].astype(np.float32)
+        else:
+            columns[col] = _categorical(df[col])
+    return pd.DataFrame(columns, index=df.index)
+
+
+# ===========================================================================
+# Storage
+# ===========================================================================
+
+
+def save_survey(df, path):
+    """Write the cleaned survey data to the Parquet file at `path`"""
+    to_columnar(df).to_parquet(path, engine="pyarrow")
+
+
+def load_survey(path):
+    """Read the survey data written by `save_survey`"""
+    return pd.read_parquet(path, engine="pyarrow")
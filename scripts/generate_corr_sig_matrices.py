@@ -1,32 +1,86 @@
 #!/usr/bin/env python3
 
+import argparse
+
 import pandas as pd
 import phik
 
-# Import dataframes
-df_merged = pd.read_pickle("data/merged.pkl")
-df_media = pd.read_pickle("data/media.pkl")
-df_civsoc = pd.read_pickle("data/civsoc.pkl")
+from lib.aggregate import COUNTRIES
+from lib.build import is_current, mark_current, stage_digest
+from lib.correlation import phik_significance_matrices
+from lib.matrices import (
+    EXPORTS,
+    KINDS,
+    export_matrix,
+    matrices_name,
+    open_answers,
+    save_index,
+    save_matrices,
+    store_paths,
+)
+
+FRAMES = ["merged", "media", "civsoc"]
+SIGNIFICANCE_METHOD = "asymptotic"
+# Number of processes computing the pairs of columns, one per CPU if None
+WORKERS = None
+
 
+def generate(frame, country="All", workers=WORKERS):
+    """Compute and store the matrices of the dataframe `frame` and their index.
 
-def save_corr_matrix(df, name):
-    corr = df.phik_matrix()
-    corr.to_pickle(f"./data/corr_sig/{name}.pkl")
-    corr.to_excel(f"./data/corr_sig/{name}.xlsx")
-    corr.to_csv(f"./data/corr_sig/{name}.csv")
+    The matrices are only computed again if the dataframe changed since the
+    last run.
 
+    Keyword arguments:
+    frame   -- the dataframe, one of FRAMES
+    country -- only use the rows of the respondents from `country`, one of
+               the country filters of the explorer (Default value = "All")
+    workers -- number of processes computing the pairs of columns, see
+               `phik_significance_matrices` (Default value = WORKERS)
+    """
+    source = f"data/{frame}.pkl"
+    name = matrices_name(frame, country)
+    digest = stage_digest(
+        [source, __file__, "lib/correlation.py", "lib/matrices.py"],
+        significance_method=SIGNIFICANCE_METHOD,
+        phik=phik.__version__,
+        country=country,
+    )
+    if is_current(f"corr_sig_{name}", digest, store_paths(name)):
+        print(f"The matrices of {name} are up to date")
+        return
+    df = pd.read_pickle(source)
+    if country != "All":
+        df = df[df.country == country]
+    # Both matrices are derived from the same contingency tables
+    corr, sig = phik_significance_matrices(
+        df, significance_method=SIGNIFICANCE_METHOD, workers=workers
+    )
+    save_matrices(name, corr, sig)
+    save_index(name, corr, sig, exclude=open_answers(df))
+    mark_current(f"corr_sig_{name}", digest)
 
-def save_sig_matrix(df, name):
-    sig = df.significance_matrix(significance_method="asymptotic")
-    sig.to_pickle(f"./data/corr_sig/{name}.pkl")
-    sig.to_excel(f"./data/corr_sig/{name}.xlsx")
-    sig.to_csv(f"./data/corr_sig/{name}.csv")
 
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compute the correlation and significance matrices"
+    )
+    parser.add_argument(
+        "--export",
+        nargs="+",
+        choices=EXPORTS,
+        default=[],
+        help="also write CSV or Excel copies of the matrices",
+    )
+    args = parser.parse_args()
+    for frame in FRAMES:
+        for country in COUNTRIES:
+            generate(frame, country)
+            for kind in KINDS:
+                for ext in args.export:
+                    name = matrices_name(frame, country)
+                    print(f"Exported {export_matrix(name, kind, ext)}")
 
-df_corr_merged = save_corr_matrix(df_merged, "merged_corr")
-df_corr_media = save_corr_matrix(df_media, "media_corr")
-df_corr_civsoc = save_corr_matrix(df_civsoc, "civsoc_corr")
 
-df_corr_merged = save_sig_matrix(df_merged, "merged_sig")
-df_corr_media = save_sig_matrix(df_media, "media_sig")
-df_corr_civsoc = save_sig_matrix(df_civsoc, "civsoc_sig")
+if __name__ == "__main__":
+    main()
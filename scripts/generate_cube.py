@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+
+from lib.aggregate import build_cube, file_digest, save_cube
+from lib.survey import load_survey
+
+
+def main():
+    # Summarise the cleaned survey data for every sidebar filter combination
+    source = "data/guardint_survey.parquet"
+    cube = build_cube(load_survey(source), source=file_digest(source))
+    save_cube(cube, "data/guardint_cube.pkl")
+
+
+if __name__ == "__main__":
+    main()
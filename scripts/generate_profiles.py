@@ -1,19 +1,39 @@
 #!/usr/bin/env python3
 
 import pandas as pd
+import pandas_profiling
 from pandas_profiling import ProfileReport
 
-# Import dataframes
-df_merged = pd.read_pickle("data/merged.pkl")
-df_media = pd.read_pickle("data/media.pkl")
-df_civsoc = pd.read_pickle("data/civsoc.pkl")
+from lib.build import is_current, mark_current, stage_digest
 
-# Generate profiles
-merged_profile = ProfileReport(df_merged, config_file="profiles/profile_merged.yml")
-merged_profile.to_file("profiles/merged.html")
+FRAMES = ["merged", "media", "civsoc"]
 
-media_profile = ProfileReport(df_media, config_file="profiles/profile_media.yml")
-media_profile.to_file("profiles/media.html")
 
-civsoc_profile = ProfileReport(df_civsoc, config_file="profiles/profile_civsoc.yml")
-civsoc_profile.to_file("profiles/civsoc.html")
+def generate(frame):
+    """Generate the profile of the dataframe `frame`.
+
+    The profile is only generated again if the dataframe or its
+    configuration changed since the last run.
+    """
+    source = f"data/{frame}.pkl"
+    config_file = f"profiles/profile_{frame}.yml"
+    output = f"profiles/{frame}.html"
+    digest = stage_digest(
+        [source, config_file, __file__],
+        pandas_profiling=pandas_profiling.__version__,
+    )
+    if is_current(f"profile_{frame}", digest, [output]):
+        print(f"The profile of {frame} is up to date")
+        return
+    profile = ProfileReport(pd.read_pickle(source), config_file=config_file)
+    profile.to_file(output)
+    mark_current(f"profile_{frame}", digest)
+
+
+def main():
+    for frame in FRAMES:
+        generate(frame)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+
+"""Serve LimeSurvey exports from a directory over a stub RemoteControl 2 API.
+
+The stub answers the calls made by get_survey_data with the exports in the
+directory, one plain CSV file per survey named after the survey in SURVEYS
+and the response type (e.g. cs_uk_short.csv). Set the url in
+scripts/config.ini to http://localhost:8765 and the user name and password
+to those given here to fetch the exports without LimeSurvey.
+
+Usage: python -m scripts.limesurvey_stub [--port 8765] [--delay 0.5] DIR
+"""
+
+import argparse
+import base64
+import csv
+import io
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pandas as pd
+
+from lib.limesurvey import BASE_FIELDS, ENDPOINT
+from scripts.get_survey_data import SURVEYS
+
+
+class StubRemoteControl:
+    """Answers RemoteControl 2 calls with the exports in a directory.
+
+    The export of the survey `sid` with response type `response_type` is
+    read from `<root>/<exports[sid]>_<response_type>.csv`, so that the
+    fetcher can be run without a LimeSurvey instance. The questions of a
+    survey are made up from the headings of its short export.
+    """
+
+    METHODS = [
+        "get_session_key",
+        "release_session_key",
+        "export_responses",
+        "list_questions",
+    ]
+
+    def __init__(self, root, exports, user_name, password, delay=0.0):
+        self.root = Path(root)
+        self.exports = exports
+        self.user_name = user_name
+        self.password = password
+        self.delay = delay
+        self.session_keys = set()
+        self._lock = threading.Lock()
+        self._counter = 0
+        self._surveys = {}
+        self._questions = {}
+
+    def _path(self, sid, response_type):
+        return self.root / f"{self.exports.get(str(sid))}_{response_type}.csv"
+
+    def _survey(self, sid):
+        """Return the questions of the survey `sid` and its headings by field"""
+        with self._lock:
+            if sid not in self._surveys:
+                self._surveys[sid] = self._make_survey(sid)
+            return self._surveys[sid]
+
+    def _make_survey(self, sid):
+        header = pd.read_csv(self._path(sid, "short"), sep=";", nrows=0).columns
+        questions = {}
+        headings = {field: field for field in BASE_FIELDS}
+        for heading in header:
+            if heading in BASE_FIELDS:
+                continue
+            title, _, sub = heading.rstrip("]").partition("[")
+            if title not in questions:
+                questions[title] = self._add_question(sid, title)
+            question = questions[title]
+            field = f"{sid}X{question['gid']}X{question['qid']}"
+            if sub == "other":
+                field += "other"
+            elif sub:
+                self._add_question(sid, sub, parent=question)
+                field += sub
+            headings[field] = heading
+        questions = [q["question"] for q in self._questions.values() if q["sid"] == sid]
+        return {"questions": questions, "headings": headings}
+
+    def _add_question(self, sid, title, parent=None):
+        self._counter += 1
+        question = {
+            "sid": int(sid),
+            "gid": 1,
+            "qid": self._counter,
+            "parent_qid": 0 if parent is None else parent["qid"],
+            "title": title,
+            "question": title,
+        }
+        self._questions[question["qid"]] = {"sid": sid, "question": question}
+        return question
+
+    def get_session_key(self, user_name, password, *_):
+        if (user_name, password) != (self.user_name, self.password):
+            return {"status": "Invalid user name or password"}
+        with self._lock:
+            self._counter += 1
+            session_key = f"stub{self._counter:08d}"
+            self.session_keys.add(session_key)
+        return session_key
+
+    def release_session_key(self, session_key):
+        with self._lock:
+            self.session_keys.discard(session_key)
+        return "OK"
+
+    def list_questions(self, session_key, sid, *_):
+        if session_key not in self.session_keys:
+            return {"status": "Invalid session key"}
+        if not self._path(sid, "short").exists():
+            return {"status": "Error: Invalid survey ID"}
+        return self._survey(str(sid))["questions"]
+
+    def export_responses(self, session_key, sid, document_type, lang, *params):
+        # params: completion_status, heading_type, response_type,
+        # from_response_id, to_response_id, fields
+        response_type, from_response_id, to_response_id, fields = params[2:6]
+        if session_key not in self.session_keys:
+            return {"status": "Invalid session key"}
+        path = self._path(sid, response_type)
+        if not path.exists():
+            return {"status": "No Data, survey table does not exist."}
+        if from_response_id is None and to_response_id is None and fields is None:
+            return base64.b64encode(path.read_bytes()).decode()
+        text = path.read_text(encoding="utf-8-sig")
+        header, *rows = csv.reader(io.StringIO(text), delimiter=";")
+        first = from_response_id or 0
+        last = to_response_id or float("inf")
+        rows = [row for row in rows if first <= int(row[header.index("id")]) <= last]
+        if not rows:
+            return {"status": "No Response found."}
+        if fields is not None:
+            # Columns are exported in the order of the survey
+            headings = self._survey(str(sid))["headings"]
+            selected = {headings[field] for field in fields if field in headings}
+            keep = [i for i, heading in enumerate(header) if heading in selected]
+            header = [header[i] for i in keep]
+            rows = [[row[i] for i in keep] for row in rows]
+        export = io.StringIO()
+        csv.writer(export, delimiter=";", lineterminator="\n").writerows(
+            [header, *rows]
+        )
+        return base64.b64encode(export.getvalue().encode()).decode()
+
+    def handle(self, payload):
+        """Return the JSON-RPC response to `payload`"""
+        if payload["method"] not in self.METHODS:
+            return {"id": payload.get("id"), "result": None, "error": "No method"}
+        # Round trips to a real instance take time
+        time.sleep(self.delay)
+        result = getattr(self, payload["method"])(*payload["params"])
+        return {"id": payload.get("id"), "result": result, "error": None}
+
+
+def stub_server(stub, port=8765):
+    """Return an HTTP server answering RemoteControl 2 calls with `stub`.
+
+    Its base URL is http://localhost:`port`.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path != ENDPOINT.format(""):
+                self.send_error(404)
+                return
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            # Slashes are escaped as by PHP's json_encode
+            body = json.dumps(stub.handle(payload)).replace("/", "\\/").encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return ThreadingHTTPServer(("localhost", port), Handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub LimeSurvey RemoteControl")
+    parser.add_argument("root", help="directory with the exports to serve")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--username", default="stub")
+    parser.add_argument("--password", default="stub")
+    parser.add_argument(
+        "--delay", type=float, default=0.0, help="seconds every call takes"
+    )
+    args = parser.parse_args()
+    exports = {sid: name for name, sid in SURVEYS.items()}
+    stub = StubRemoteControl(
+        args.root, exports, args.username, args.password, delay=args.delay
+    )
+    server = stub_server(stub, args.port)
+    print(f"Serving {args.root} at http://localhost:{args.port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+"""Run the data pipeline, or the part of it needed for the given stages.
+
+Stages that do not depend on each other run at the same time, and the wall
+time of every stage is reported. Every stage skips its work if its inputs
+have not changed since the last run.
+
+Usage: python -m scripts.pipeline [--skip STAGE ...] [STAGE ...]
+"""
+
+import argparse
+import time
+from functools import partial
+
+from lib.aggregate import COUNTRIES
+from lib.matrices import matrices_name
+from lib.pipeline import run_pipeline, stage
+
+FRAMES = ["merged", "media", "civsoc"]
+
+STAGES = {
+    "fetch": stage("scripts.get_survey_data:fetch", True),
+    "clean": stage("scripts.clean:clean", after=["fetch"]),
+    "split": stage("scripts.clean:split", after=["clean"]),
+    "cube": stage("scripts.generate_cube:main", after=["parquet"]),
+    "figures": stage("scripts.prebuild_figures:main", after=["parquet", "cube"]),
+}
+for ext in ["parquet", "xlsx", "csv"]:
+    STAGES[ext] = stage("scripts.clean:write_survey", ext, after=["clean"])
+for frame in FRAMES:
+    # The matrices of every sidebar filter combination of the explorer. The
+    # stages already run one per CPU, so each one computes its pairs of
+    # columns in its own process
+    for country in COUNTRIES:
+        STAGES[f"corr_sig_{matrices_name(frame, country)}"] = stage(
+            "scripts.generate_corr_sig_matrices:generate",
+            frame,
+            country,
+            1,
+            after=["split"],
+        )
+    STAGES[f"profile_{frame}"] = stage(
+        "scripts.generate_profiles:generate", frame, after=["split"]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the data pipeline")
+    parser.add_argument(
+        "stages",
+        nargs="*",
+        help="stages to run, with the stages they depend on (default: all)",
+    )
+    parser.add_argument(
+        "--skip",
+        nargs="+",
+        default=[],
+        choices=list(STAGES),
+        help="stages to leave out, e.g. fetch to work on the exports at hand",
+    )
+    args = parser.parse_args()
+    for name in args.stages:
+        if name not in STAGES:
+            parser.error(f"unknown stage {name!r} (choose from {', '.join(STAGES)})")
+    start = time.perf_counter()
+    report = partial(print, flush=True)
+    run_pipeline(STAGES, targets=args.stages, skip=args.skip, report=report)
+    print(f"{'total':<30} {time.perf_counter() - start:8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
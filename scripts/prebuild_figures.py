@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+import shutil
+
+import explorer
+from lib.aggregate import FILTER_KEYS, file_digest
+from lib.store import write_figure, write_manifest
+
+
+def main():
+    # Render every section of the explorer for every sidebar filter
+    # combination and store the figures, so that the explorer can serve them
+    # as they are
+    shutil.rmtree(explorer.FIGURES, ignore_errors=True)
+    for section, render in explorer.SECTIONS.items():
+        for country, field in FILTER_KEYS:
+            explorer.select(section, country, field)
+            render()
+            for name, figure in explorer.shown.items():
+                write_figure(explorer.FIGURES, section, country, field, name, figure)
+    write_manifest(
+        explorer.FIGURES,
+        source=file_digest(explorer.SURVEY),
+        code=explorer.code_digest(),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Tests of the cleaning of the LimeSurvey exports in scripts/clean.py"""
+
+import csv
+import gzip
+import io
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lib.ingest import CODED, MULTIPLE_CHOICE
+from lib.snapshots import snapshot_path
+from scripts.clean import EXPORTS, SURVEY, clean, write_survey
+from scripts.get_survey_data import HEADINGS
+
+CODES = [f"AO{i:02d}" for i in range(1, 12)] + [""]
+# Answers to the questions that are not read as codes, of which some are
+# numbers only in some of the rows
+TEXT = ["7", "12", "some text", "0,5", "?", "<1", "20+", "10 fois.", ""]
+NUMBERS = ["7", "12", "3", ""]
+
+
+def answers(heading, column, rng, n, free):
+    name = column[2:]
+    if heading == "submitdate":
+        return rng.choice(["2021-10-01 10:00:00", ""], n)
+    if name == "country":
+        return rng.choice(["en", "de", "fr"], n)
+    if name == "lastpage":
+        return rng.choice(["1", "3", "5", "9", ""], n)
+    if name in CODED:
+        return rng.choice(CODES, n)
+    if name.startswith(MULTIPLE_CHOICE):
+        return rng.choice(["Y", ""], n)
+    return rng.choice(free, n)
+
+
+def export_rows(directory, rng, first, n, free):
+    """Return `n` rows of the export in `directory` from the id `first` on"""
+    _, rename, *_ = next(export for export in EXPORTS if export[0] == directory)
+    headings = HEADINGS[directory]
+    columns = [
+        answers(heading, rename.get(heading, heading), rng, n, free)
+        for heading in headings
+    ]
+    columns[0] = [str(first + i) for i in range(n)]
+    return headings, list(zip(*columns))
+
+
+def to_csv(rows):
+    text = io.StringIO()
+    csv.writer(text, delimiter=";", lineterminator="\n").writerows(rows)
+    return text.getvalue().encode()
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # clean digests its code by paths relative to the repository
+    (tmp_path / "lib").symlink_to(Path("lib").resolve())
+    (tmp_path / "scripts").symlink_to(Path("scripts").resolve())
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_delta_clean_equals_full_clean(workdir):
+    rng = np.random.default_rng(1)
+    for directory, *_ in EXPORTS:
+        Path(directory).mkdir(parents=True)
+        header, rows = export_rows(directory, rng, 1, 40, TEXT)
+        old = gzip.compress(to_csv([header, *rows]))
+        Path(snapshot_path(directory, "20211014T120000Z")).write_bytes(old)
+        # A delta fetch appends its rows as another gzip member: those of
+        # responses that were not submitted at the last fetch, which replace
+        # the earlier ones, and new ones, here with open answers that all
+        # read as numbers
+        _, delta = export_rows(directory, rng, 38, 13, NUMBERS)
+        new = old + gzip.compress(to_csv(delta))
+        Path(snapshot_path(directory, "20211015T120000Z")).write_bytes(new)
+        # The export as a full fetch would have downloaded it
+        full = gzip.compress(to_csv([header, *rows[:37], *delta]))
+        Path(snapshot_path(directory, "20211016T120000Z")).write_bytes(full)
+
+    clean("20211014T120000Z")
+    clean("20211015T120000Z")
+    delta = pd.read_pickle(SURVEY)
+    write_survey("parquet")
+
+    shutil.rmtree(workdir / "data/build")
+    clean("20211015T120000Z")
+    pd.testing.assert_frame_equal(delta, pd.read_pickle(SURVEY))
+    clean()
+    pd.testing.assert_frame_equal(delta, pd.read_pickle(SURVEY))
@@ -0,0 +1,145 @@
+"""Tests of the LimeSurvey client against the stub of scripts/limesurvey_stub.py"""
+
+import gzip
+import threading
+
+import pandas as pd
+import pytest
+
+from lib import limesurvey
+from lib.limesurvey import (
+    RemoteControl,
+    download_exports,
+    export_fields,
+    survey_columns,
+)
+from scripts.limesurvey_stub import StubRemoteControl, stub_server
+
+SID = "123456"
+# Slashes and non-ASCII answers put "/" and "+" into the base64 of the export
+EXPORT = (
+    "id;submitdate;lastpage;q1;q2[a];q2[b];q3\n"
+    "1;2021-10-01 10:00:00;5;A1;Y;;and/or\n"
+    "2;2021-10-02 11:00:00;5;A2;;Y;Überwachung\n"
+    "3;2021-10-03 12:00:00;3;A1;Y;Y;\n"
+)
+NEW_ROWS = "4;2021-10-04 13:00:00;5;A3;;;n/a\n5;2021-10-05 14:00:00;4;A2;Y;;\n"
+
+
+@pytest.fixture
+def root(tmp_path):
+    root = tmp_path / "exports"
+    root.mkdir()
+    (root / "demo_short.csv").write_text("\ufeff" + EXPORT, encoding="utf-8")
+    return root
+
+
+@pytest.fixture
+def stub(root):
+    return StubRemoteControl(root, {SID: "demo"}, "stub", "stub")
+
+
+@pytest.fixture
+def client(stub, monkeypatch):
+    # Small chunks split the base64 text, and its escaped slashes, anywhere
+    monkeypatch.setattr(limesurvey, "CHUNK_SIZE", 7)
+    server = stub_server(stub, 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://localhost:{server.server_address[1]}"
+    try:
+        with RemoteControl(url, "stub", "stub", 1) as client:
+            yield client
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1 << 16])
+@pytest.mark.parametrize("name", ["export.csv", "export.csv.gz"])
+def test_export_is_decoded_while_streamed(
+    client, tmp_path, monkeypatch, name, chunk_size
+):
+    monkeypatch.setattr(limesurvey, "CHUNK_SIZE", chunk_size)
+    path = tmp_path / name
+    client.export_responses(path, SID)
+    if name.endswith(".gz"):
+        data = gzip.decompress(path.read_bytes())
+    else:
+        data = path.read_bytes()
+    # The byte order mark is dropped
+    assert data == EXPORT.encode("utf-8")
+    assert not (tmp_path / f"export.part{path.suffix}").exists()
+
+
+@pytest.mark.parametrize("result", [None, 42, {"status": "Error"}])
+def test_failed_export_keeps_the_previous_one(client, stub, tmp_path, result):
+    path = tmp_path / "export.csv.gz"
+    client.export_responses(path, SID)
+    exported = path.read_bytes()
+
+    stub.export_responses = lambda *params: result
+    with pytest.raises(ValueError):
+        client.export_responses(path, SID)
+    assert path.read_bytes() == exported
+    assert not (tmp_path / "export.part.csv.gz").exists()
+
+
+def test_failed_call_raises(client):
+    # The stub answers unknown methods with an error and a null result
+    with pytest.raises(ValueError, match="No method"):
+        client.call("get_summary", client.session_key, SID)
+
+
+def test_delta_appends_new_responses(client, root, tmp_path):
+    old = tmp_path / "old.csv.gz"
+    download_exports(client, {old: {"sid": SID}})
+    with open(root / "demo_short.csv", "a", encoding="utf-8") as file:
+        file.write(NEW_ROWS)
+
+    new = tmp_path / "new.csv.gz"
+    assert download_exports(client, {new: {"sid": SID}}, previous={new: old}) == [new]
+    # The previous export is a prefix of the new one, with the new rows
+    # appended as another gzip member
+    assert new.read_bytes().startswith(old.read_bytes())
+    expected = pd.read_csv(root / "demo_short.csv", sep=";", encoding="utf-8-sig")
+    pd.testing.assert_frame_equal(pd.read_csv(new, sep=";"), expected)
+
+    newer = tmp_path / "newer.csv.gz"
+    assert download_exports(client, {newer: {"sid": SID}}, previous={newer: new}) == []
+    assert not newer.exists()
+
+
+def test_delta_fetches_unsubmitted_responses_again(client, root, tmp_path):
+    export = root / "demo_short.csv"
+    # The fourth response is still being answered
+    export.write_text(EXPORT + "4;;2;A3;;;\n", encoding="utf-8")
+    old = tmp_path / "old.csv.gz"
+    download_exports(client, {old: {"sid": SID}})
+
+    new = tmp_path / "new.csv.gz"
+    assert download_exports(client, {new: {"sid": SID}}, previous={new: old}) == []
+
+    export.write_text(EXPORT + "4;2021-10-04 13:00:00;5;A3;;Y;\n", encoding="utf-8")
+    assert download_exports(client, {new: {"sid": SID}}, previous={new: old}) == [new]
+    df = pd.read_csv(new, sep=";")
+    assert df["id"].tolist() == [1, 2, 3, 4, 4]
+    # The response downloaded again comes last, as it was submitted
+    expected = pd.read_csv(export, sep=";")
+    pd.testing.assert_frame_equal(
+        df.drop_duplicates("id", keep="last").reset_index(drop=True), expected
+    )
+
+
+def test_only_the_fields_asked_for_are_exported(client, tmp_path):
+    columns = survey_columns(client.call("list_questions", client.session_key, SID))
+    fields = export_fields(columns, ["id", "q3", "q2[b]"])
+    path = tmp_path / "export.csv"
+    client.export_responses(path, SID, fields=fields)
+    df = pd.read_csv(path, sep=";")
+    # Columns are exported in the order of the survey
+    assert list(df.columns) == ["id", "q2[b]", "q3"]
+    assert df["id"].tolist() == [1, 2, 3]
+
+    with pytest.raises(ValueError):
+        export_fields(columns, ["id", "q4"])